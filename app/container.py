@@ -6,10 +6,22 @@ and injects dependencies throughout the application lifecycle.
 """
 
 from __future__ import annotations
-from typing import Any, Callable, Dict, Optional, Type, TypeVar
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional, Set, Tuple, TypeVar, Union,
+)
+
+if TYPE_CHECKING:
+    from app.database.connection import DatabaseConnection
 
 T = TypeVar("T")
 
+# Registrations are keyed by the interface class itself (hashed by identity)
+# or, for infrastructure without an interface, by a plain name.
+InterfaceKey = Union[type, str]
+
+# Marks a registry entry whose instance has not been created yet
+_UNSET: Any = object()
+
 
 class DIContainer:
     """
@@ -19,66 +31,140 @@ class DIContainer:
     - Singleton registrations (one instance per container lifetime)
     - Factory registrations (new instance on every resolve)
     - Instance registrations (pre-built objects)
+
+    Every registration lives in one flat table mapping the interface (class
+    or name) to ``(factory, cached_instance, is_singleton)`` so a resolve
+    costs a single dict lookup.
     """
 
     def __init__(self) -> None:
-        self._singletons: Dict[str, Any] = {}
-        self._factories: Dict[str, Callable[[], Any]] = {}
-        self._singleton_flags: Dict[str, bool] = {}
+        self._registry: Dict[InterfaceKey, Tuple[Optional[Callable[[], Any]], Any, bool]] = {}
+        # Attribute names set by resolve_fast (and only those may be dropped)
+        self._fast_attrs: Set[str] = set()
+        # Resolved application graph, set once the bootstrapper has wired it
+        self.services: Optional[Services] = None
 
     # ------------------------------------------------------------------
     # Registration API
     # ------------------------------------------------------------------
 
-    def register_singleton(self, interface: str, factory: Callable[[], T]) -> None:
+    def register_singleton(self, interface: InterfaceKey, factory: Callable[[], T]) -> None:
         """Register a factory that is resolved only once (singleton)."""
-        self._factories[interface] = factory
-        self._singleton_flags[interface] = True
+        self._register(interface, (factory, _UNSET, True))
 
-    def register_factory(self, interface: str, factory: Callable[[], T]) -> None:
+    def register_factory(self, interface: InterfaceKey, factory: Callable[[], T]) -> None:
         """Register a factory that creates a new instance on each resolve."""
-        self._factories[interface] = factory
-        self._singleton_flags[interface] = False
+        self._register(interface, (factory, _UNSET, False))
 
-    def register_instance(self, interface: str, instance: Any) -> None:
+    def register_instance(self, interface: InterfaceKey, instance: Any) -> None:
         """Register a pre-created object as a singleton."""
-        self._singletons[interface] = instance
-        self._singleton_flags[interface] = True
+        self._register(interface, (None, instance, True))
+
+    def _register(
+        self,
+        interface: InterfaceKey,
+        entry: Tuple[Optional[Callable[[], Any]], Any, bool],
+    ) -> None:
+        self._registry[interface] = entry
+        # Drop any attribute cached by resolve_fast for the old registration
+        if interface in self._fast_attrs:
+            self._fast_attrs.discard(interface)
+            del self.__dict__[interface]
 
     # ------------------------------------------------------------------
     # Resolution API
     # ------------------------------------------------------------------
 
-    def resolve(self, interface: str) -> Any:
+    def resolve(self, interface: InterfaceKey) -> Any:
         """
-        Resolve a registered dependency by its interface name.
+        Resolve a registered dependency by its interface class or name.
 
         Raises:
             KeyError: If the interface has not been registered.
         """
-        # Return cached singleton
-        if interface in self._singletons:
-            return self._singletons[interface]
-
-        if interface not in self._factories:
+        try:
+            factory, cached, singleton = self._registry[interface]
+        except KeyError:
+            name = getattr(interface, "__name__", interface)
             raise KeyError(
-                f"[DIContainer] Dependency '{interface}' is not registered."
-            )
+                f"[DIContainer] Dependency '{name}' is not registered."
+            ) from None
 
-        instance = self._factories[interface]()
+        # Return cached singleton
+        if cached is not _UNSET:
+            return cached
+
+        instance = factory()
 
         # Cache if singleton
-        if self._singleton_flags.get(interface, False):
-            self._singletons[interface] = instance
+        if singleton:
+            self._registry[interface] = (factory, instance, True)
+
+        return instance
 
+    def resolve_fast(self, interface: InterfaceKey) -> Any:
+        """
+        Resolve like ``resolve`` and, for singletons, also cache the
+        instance as an attribute named after the interface.
+
+        Hot-path callers can then read ``container.<interface>`` directly
+        (a plain attribute load) and fall back to this method on a miss.
+        Names that are not identifiers or that would shadow a container
+        method or attribute are never cached, and neither are class keys.
+        """
+        instance = self.resolve(interface)
+        if (
+            self._registry[interface][2]
+            and isinstance(interface, str)
+            and interface.isidentifier()
+            and not hasattr(type(self), interface)
+            and (interface in self._fast_attrs or interface not in self.__dict__)
+        ):
+            setattr(self, interface, instance)
+            self._fast_attrs.add(interface)
         return instance
 
-    def is_registered(self, interface: str) -> bool:
+    def eager_resolve(self, interfaces: Iterable[InterfaceKey]) -> None:
+        """
+        Build the given singletons now, in the order listed.
+
+        List dependencies before their dependants: each factory then finds
+        its own dependencies already cached, and every later ``resolve``
+        is a plain cache hit.
+        """
+        for interface in interfaces:
+            self.resolve(interface)
+
+    def is_registered(self, interface: InterfaceKey) -> bool:
         """Check whether an interface is registered in the container."""
-        return interface in self._factories or interface in self._singletons
+        return interface in self._registry
+
+
+class Services:
+    """
+    The resolved application object graph as plain slotted attributes.
+
+    Built once, after wiring, from the container's singletons so hot paths
+    reach a service with one attribute load instead of a ``resolve`` call.
+    """
+
+    __slots__ = ("db", "hospital_repo", "hospital_svc")
+
+    def __init__(self, db: Any, hospital_repo: Any, hospital_svc: Any) -> None:
+        self.db = db
+        self.hospital_repo = hospital_repo
+        self.hospital_svc = hospital_svc
 
 
 # ---------------------------------------------------------------------------
 # Module-level singleton container instance
 # ---------------------------------------------------------------------------
 container = DIContainer()
+
+
+def db() -> "DatabaseConnection":
+    """Return the shared DatabaseConnection (an attribute load once cached)."""
+    try:
+        return container.DatabaseConnection
+    except AttributeError:
+        return container.resolve_fast("DatabaseConnection")
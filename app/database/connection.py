@@ -7,52 +7,205 @@ protocol and exposes a thread-safe connection pool pattern.
 
 from __future__ import annotations
 
+import os
 import sqlite3
 import threading
+import weakref
 from pathlib import Path
 from typing import Optional
 
 
-class DatabaseConnection:
+# Connections kept open after their thread exits, ready for the next new
+# thread (e.g. one per request under a threaded server) to reuse.
+_MAX_IDLE_CONNECTIONS = 4
+
+
+def _close_quietly(conn: sqlite3.Connection) -> None:
+    try:
+        conn.close()
+    except sqlite3.Error:
+        pass
+
+
+def _release(mgr_ref: "weakref.ref[DatabaseConnection]", conn: sqlite3.Connection,
+             generation: int) -> None:
+    """Finalizer of a thread's connection: park it for reuse, else close it."""
+    mgr = mgr_ref()
+    if mgr is None or not mgr._recycle(conn, generation):
+        _close_quietly(conn)
+
+
+class _ConnHolder:
     """
-    Manages a single SQLite database connection for the application.
+    A thread's connection, owned through the manager's ``threading.local``.
 
-    Uses a threading lock to make connection access safe in a
-    multi-threaded desktop application.
+    When the thread exits its local storage is released, the holder dies
+    and its finalizer hands the connection back (see ``_release``).
+    """
+
+    __slots__ = ("conn", "generation", "finalizer", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection, generation: int) -> None:
+        self.conn = conn
+        self.generation = generation
+        self.finalizer: Optional[weakref.finalize] = None
+
+
+class DatabaseConnection:
+    """
+    Manages per-thread SQLite connections for the application.
+
+    Each thread lazily takes its own connection (stored in a
+    ``threading.local``), so repository calls from different threads
+    never contend on a shared lock.  With WAL enabled, reader threads
+    run in parallel with the single writer.  When a thread exits, its
+    connection is parked in a small idle pool for the next thread, or
+    closed if the pool is full, so short-lived threads neither leak
+    connections nor pay for opening and tuning a new one each time.
+
+    No I/O happens until the first ``get_connection`` call.  Register it
+    in the DI container with ``register_singleton(lambda: ...)`` rather
+    than ``register_instance`` so processes that never query the
+    database never construct it.
     """
 
     def __init__(self, db_path: str | Path) -> None:
         self._db_path = Path(db_path)
-        self._connection: Optional[sqlite3.Connection] = None
-        self._lock = threading.Lock()
-        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        # Holders of every live thread's connection, so close() can reach
+        # them; entries vanish when their thread exits.
+        self._holders: "weakref.WeakSet[_ConnHolder]" = weakref.WeakSet()
+        self._idle: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()   # guards _holders and _idle
+        self._generation = 0            # bumped by close() to invalidate locals
+        # The data directory is created on first connect, not here, so that
+        # constructing the object never touches the disk.
+        self._dir_ensured = False
+        # Connections inherited from a parent process; kept referenced (and
+        # never closed) so the child cannot disturb the parent's handles.
+        self._inherited: list[sqlite3.Connection] = []
+
+        if hasattr(os, "register_at_fork"):   # POSIX only
+            ref = weakref.ref(self)
+
+            def _after_fork_in_child() -> None:
+                conn_mgr = ref()
+                if conn_mgr is not None:
+                    conn_mgr._after_fork()
+
+            os.register_at_fork(after_in_child=_after_fork_in_child)
+
+    @property
+    def db_path(self) -> Path:
+        """Location of the SQLite database file."""
+        return self._db_path
 
     # ------------------------------------------------------------------
     # Connection Management
     # ------------------------------------------------------------------
 
     def get_connection(self) -> sqlite3.Connection:
-        """Return the active connection, creating it if necessary."""
+        """Return the calling thread's connection, creating it if necessary."""
+        # Fast path: no lock and no extra call once this thread is connected.
+        holder = getattr(self._local, "holder", None)
+        if holder is not None and holder.generation == self._generation:
+            return holder.conn
+
+        with self._lock:
+            generation = self._generation
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = self._open()
+
+        holder = _ConnHolder(conn, generation)
+        holder.finalizer = weakref.finalize(
+            holder, _release, weakref.ref(self), conn, generation
+        )
         with self._lock:
-            if self._connection is None:
-                self._connection = sqlite3.connect(
-                    str(self._db_path),
-                    check_same_thread=False,
-                    detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
-                )
-                # Enable foreign key support
-                self._connection.execute("PRAGMA foreign_keys = ON")
-                # Return rows as dict-like objects
-                self._connection.row_factory = sqlite3.Row
-        return self._connection
+            self._holders.add(holder)
+        self._local.holder = holder
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        """Open and tune a new connection."""
+        if not self._dir_ensured:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._dir_ensured = True
+
+        conn = sqlite3.connect(
+            str(self._db_path),
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        # Enable foreign key support
+        conn.execute("PRAGMA foreign_keys = ON")
+        # Return rows as dict-like objects
+        conn.row_factory = sqlite3.Row
+        self._apply_pragmas(conn)
+        return conn
+
+    def _recycle(self, conn: sqlite3.Connection, generation: int) -> bool:
+        """Park a dead thread's connection for reuse; False if it must close."""
+        with self._lock:
+            if generation != self._generation or len(self._idle) >= _MAX_IDLE_CONNECTIONS:
+                return False
+            try:
+                conn.rollback()         # never hand over a half-done transaction
+            except sqlite3.Error:
+                return False
+            self._idle.append(conn)
+            return True
+
+    @staticmethod
+    def _apply_pragmas(conn: sqlite3.Connection) -> None:
+        """Tune SQLite for concurrent readers and a single writer (WAL)."""
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -20000")      # ~20 MB page cache
+        conn.execute("PRAGMA mmap_size = 268435456")    # 256 MB memory map
+        conn.execute("PRAGMA busy_timeout = 5000")      # wait up to 5 s on locks
+
+    def _current(self) -> Optional[sqlite3.Connection]:
+        """Return the calling thread's live connection without creating one."""
+        holder = getattr(self._local, "holder", None)
+        if holder is not None and holder.generation == self._generation:
+            return holder.conn
+        return None
+
+    def _after_fork(self) -> None:
+        """
+        Drop every connection inherited across ``fork()``.
+
+        SQLite handles must not be used in a forked child, so the child
+        opens fresh connections on demand (e.g. under ``gunicorn --preload``).
+        The inherited handles' finalizers are detached so they are never
+        closed or recycled here.
+        """
+        self._lock = threading.Lock()
+        for holder in list(self._holders):
+            if holder.finalizer is not None and holder.finalizer.detach():
+                self._inherited.append(holder.conn)
+        self._inherited.extend(self._idle)
+        self._holders = weakref.WeakSet()
+        self._idle = []
+        self._generation += 1
 
     def close(self) -> None:
-        """Commit any pending transaction and close the connection."""
+        """Commit any pending transactions and close every connection."""
         with self._lock:
-            if self._connection:
-                self._connection.commit()
-                self._connection.close()
-                self._connection = None
+            holders = list(self._holders)
+            idle, self._idle = self._idle, []
+            self._generation += 1       # finalizers now close instead of recycle
+        for holder in holders:
+            try:
+                holder.conn.commit()
+            except sqlite3.Error:
+                pass                    # already closed
+            if holder.finalizer is not None:
+                holder.finalizer()
+        for conn in idle:
+            _close_quietly(conn)
 
     # ------------------------------------------------------------------
     # Context Manager Protocol
@@ -62,10 +215,13 @@ class DatabaseConnection:
         return self.get_connection()
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore[override]
+        conn = self._current()
+        if conn is None:
+            return
         if exc_type:
-            self._connection and self._connection.rollback()
+            conn.rollback()
         else:
-            self._connection and self._connection.commit()
+            conn.commit()
 
     # ------------------------------------------------------------------
     # Convenience helpers
@@ -80,9 +236,11 @@ class DatabaseConnection:
         return conn.executemany(sql, params_seq)
 
     def commit(self) -> None:
-        if self._connection:
-            self._connection.commit()
+        conn = self._current()
+        if conn:
+            conn.commit()
 
     def rollback(self) -> None:
-        if self._connection:
-            self._connection.rollback()
+        conn = self._current()
+        if conn:
+            conn.rollback()
@@ -7,6 +7,9 @@ in a single, versioned migration approach.
 
 from __future__ import annotations
 
+import sqlite3
+from urllib.parse import quote
+
 from app.database.connection import DatabaseConnection
 
 
@@ -79,6 +82,25 @@ CREATE UNIQUE INDEX IF NOT EXISTS idx_hospitals_license
     ON hospitals (license_number);
 """
 
+# Case-insensitive name index – lets SQLite answer ``hospital_name LIKE 'abc%'``
+# with an index range scan instead of a full table scan.
+SQL_CREATE_HOSPITALS_IDX_NAME = """
+CREATE INDEX IF NOT EXISTS idx_hospitals_name
+    ON hospitals (hospital_name COLLATE NOCASE);
+"""
+
+# Replaces the NOCASE index above with a BINARY one.  Listings and search
+# ORDER BY hospital_name (BINARY), so this index hands SQLite the rows
+# already sorted and the temp B-tree sort disappears.
+SQL_DROP_HOSPITALS_IDX_NAME = """
+DROP INDEX IF EXISTS idx_hospitals_name;
+"""
+
+SQL_CREATE_HOSPITALS_IDX_NAME_BINARY = """
+CREATE INDEX IF NOT EXISTS idx_hospitals_name
+    ON hospitals (hospital_name);
+"""
+
 # ---------------------------------------------------------------------------
 # DDL – Schema version tracking
 # ---------------------------------------------------------------------------
@@ -107,8 +129,26 @@ MIGRATIONS: list[tuple[int, str, list[str]]] = [
             SQL_CREATE_HOSPITALS_IDX_LICENSE,
         ],
     ),
+    (
+        2,
+        "Case-insensitive index on hospitals.hospital_name",
+        [
+            SQL_CREATE_HOSPITALS_IDX_NAME,
+        ],
+    ),
+    (
+        3,
+        "Order-preserving (BINARY) index on hospitals.hospital_name",
+        [
+            SQL_DROP_HOSPITALS_IDX_NAME,
+            SQL_CREATE_HOSPITALS_IDX_NAME_BINARY,
+        ],
+    ),
 ]
 
+# Highest migration version; mirrored into SQLite's PRAGMA user_version
+LATEST_VERSION = MIGRATIONS[-1][0]
+
 
 class SchemaManager:
     """Applies pending DDL migrations to bring the database up to date."""
@@ -120,17 +160,46 @@ class SchemaManager:
     # Public API
     # ------------------------------------------------------------------
 
+    def migrate_if_needed(self) -> bool:
+        """
+        Run ``migrate`` unless the database is already current.
+
+        ``PRAGMA user_version`` lives in the database header, so the
+        steady-state check is a single read that needs no table lookups.
+        It is made over a short-lived read-only connection: workers that
+        find the schema current never open (or tune) a write connection.
+        Returns True if ``migrate`` ran.
+        """
+        if self._probe_user_version() >= LATEST_VERSION:
+            return False
+        self.migrate()
+        return True
+
     def migrate(self) -> None:
-        """Apply all pending migrations in version order."""
-        self._ensure_version_table()
-        current_version = self._get_current_version()
+        """
+        Apply all pending migrations in version order.
+
+        Safe to run from several processes at once: each step takes the
+        write lock (BEGIN IMMEDIATE) and re-reads the applied version under
+        it, so a step another worker has just applied is skipped.
+        Every step runs on the calling thread's one pooled connection.
+        """
+        conn = self._db.get_connection()
+        self._ensure_version_table(conn)
+        current_version = self._get_current_version(conn)
 
         for version, description, statements in MIGRATIONS:
             if version <= current_version:
                 continue  # Already applied
 
-            conn = self._db.get_connection()
+            # The DDL and the version row share one transaction, so a
+            # failure rolls back every statement of the step.
             try:
+                conn.execute("BEGIN IMMEDIATE")
+                current_version = self._get_current_version(conn)
+                if version <= current_version:
+                    conn.rollback()      # applied by a concurrent worker
+                    continue
                 for sql in statements:
                     conn.execute(sql)
                 conn.execute(
@@ -145,17 +214,36 @@ class SchemaManager:
                     f"[SchemaManager] Migration v{version} failed: {exc}"
                 ) from exc
 
+        # Record the result for migrate_if_needed (also brings databases
+        # migrated before user_version was tracked up to date).
+        conn.execute(f"PRAGMA user_version = {LATEST_VERSION}")
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _ensure_version_table(self) -> None:
-        conn = self._db.get_connection()
+    def _probe_user_version(self) -> int:
+        """Read PRAGMA user_version read-only; 0 if there is no database yet."""
+        uri = f"file:{quote(str(self._db.db_path))}?mode=ro"
+        try:
+            conn = sqlite3.connect(uri, uri=True)
+        except sqlite3.OperationalError:
+            return 0                     # file does not exist yet
+        try:
+            return conn.execute("PRAGMA user_version").fetchone()[0]
+        except sqlite3.DatabaseError:
+            return 0
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _ensure_version_table(conn: sqlite3.Connection) -> None:
         conn.execute(SQL_CREATE_SCHEMA_VERSION)
         conn.commit()
 
-    def _get_current_version(self) -> int:
-        cursor = self._db.execute(
+    @staticmethod
+    def _get_current_version(conn: sqlite3.Connection) -> int:
+        cursor = conn.execute(
             "SELECT COALESCE(MAX(version), 0) FROM schema_version"
         )
         row = cursor.fetchone()
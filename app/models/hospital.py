@@ -7,11 +7,12 @@ logic is placed here – this is pure data definition.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Hospital:
     """Represents a registered hospital in the HMS system."""
 
@@ -72,35 +73,53 @@ class Hospital:
 
     @classmethod
     def from_row(cls, row) -> "Hospital":
-        """Construct a Hospital from a sqlite3.Row or dict-like object."""
+        """
+        Construct a Hospital from a sqlite3.Row or tuple.
+
+        The row must list its columns in the repository's ``_SELECT_COLS``
+        order; values are unpacked positionally, which avoids hashing a
+        column name for every field.
+        """
+        (
+            id_, hospital_name, registration_number, hospital_type,
+            specialization_type, address_line1, address_line2, city, state,
+            pin_code, country, phone_primary, phone_alternate,
+            emergency_contact, email, website, total_beds, icu_beds,
+            operation_theaters, administrator_name, license_number,
+            accreditation, established_year, gstin, is_active, created_at,
+            updated_at,
+        ) = row
+        # Categorical columns have only a handful of distinct values, so
+        # intern them: rows share one str object per value.
+        _intern = sys.intern
         return cls(
-            id=row["id"],
-            hospital_name=row["hospital_name"],
-            registration_number=row["registration_number"],
-            hospital_type=row["hospital_type"],
-            specialization_type=row["specialization_type"],
-            address_line1=row["address_line1"],
-            address_line2=row["address_line2"],
-            city=row["city"],
-            state=row["state"],
-            pin_code=row["pin_code"],
-            country=row["country"],
-            phone_primary=row["phone_primary"],
-            phone_alternate=row["phone_alternate"],
-            emergency_contact=row["emergency_contact"],
-            email=row["email"],
-            website=row["website"],
-            total_beds=row["total_beds"],
-            icu_beds=row["icu_beds"],
-            operation_theaters=row["operation_theaters"],
-            administrator_name=row["administrator_name"],
-            license_number=row["license_number"],
-            accreditation=row["accreditation"],
-            established_year=row["established_year"],
-            gstin=row["gstin"],
-            is_active=bool(row["is_active"]),
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
+            id=id_,
+            hospital_name=hospital_name,
+            registration_number=registration_number,
+            hospital_type=_intern(hospital_type),
+            specialization_type=_intern(specialization_type),
+            address_line1=address_line1,
+            address_line2=address_line2,
+            city=city,
+            state=_intern(state),
+            pin_code=pin_code,
+            country=_intern(country),
+            phone_primary=phone_primary,
+            phone_alternate=phone_alternate,
+            emergency_contact=emergency_contact,
+            email=email,
+            website=website,
+            total_beds=total_beds,
+            icu_beds=icu_beds,
+            operation_theaters=operation_theaters,
+            administrator_name=administrator_name,
+            license_number=license_number,
+            accreditation=_intern(accreditation) if accreditation is not None else None,
+            established_year=established_year,
+            gstin=gstin,
+            is_active=bool(is_active),
+            created_at=created_at,
+            updated_at=updated_at,
         )
 
 
@@ -136,3 +155,9 @@ INDIA_STATES = [
     "Daman and Diu", "Delhi", "Jammu and Kashmir", "Ladakh",
     "Lakshadweep", "Puducherry",
 ]
+
+# Seed the intern table with the known categorical values so rows loaded by
+# ``Hospital.from_row`` share the very objects held in these lists.
+for _values in (HOSPITAL_TYPES, SPECIALIZATION_TYPES, ACCREDITATION_OPTIONS, INDIA_STATES):
+    _values[:] = [sys.intern(v) for v in _values]
+del _values
@@ -10,13 +10,25 @@ decoupled from the storage technology.
 
 from __future__ import annotations
 
+import sqlite3
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from app.database.connection import DatabaseConnection
 from app.models.hospital import Hospital
 
 
+# ---------------------------------------------------------------------------
+# Errors
+# ---------------------------------------------------------------------------
+
+# Base class of every storage error a repository call may raise.  Callers
+# catch this instead of depending on the sqlite3 module directly.
+RepositoryError = sqlite3.Error
+
+
 # ---------------------------------------------------------------------------
 # Abstract Interface (the contract)
 # ---------------------------------------------------------------------------
@@ -25,8 +37,24 @@ class IHospitalRepository(ABC):
     """Contract that every hospital data-access implementation must satisfy."""
 
     @abstractmethod
-    def add(self, hospital: Hospital) -> Hospital:
-        """Persist a new hospital and return it with its generated id."""
+    def add(
+        self, hospital: Hospital, commit: bool = True
+    ) -> Tuple[Hospital, Optional[str]]:
+        """
+        Persist a new hospital and return ``(hospital, conflict_field)``.
+
+        On success the hospital carries its generated id and
+        ``conflict_field`` is None.  If a UNIQUE column is already taken,
+        nothing is written and ``conflict_field`` names that column
+        (e.g. ``"registration_number"``).
+
+        Pass ``commit=False`` to leave the row in the caller's open
+        transaction (the caller is then responsible for committing).
+        """
+
+    @abstractmethod
+    def add_many(self, hospitals: Iterable[Hospital]) -> None:
+        """Persist many hospitals in a single transaction."""
 
     @abstractmethod
     def update(self, hospital: Hospital) -> Hospital:
@@ -44,6 +72,18 @@ class IHospitalRepository(ABC):
     def find_all(self, active_only: bool = True) -> List[Hospital]:
         """Return all (optionally only active) hospitals."""
 
+    @abstractmethod
+    def iter_all(self, active_only: bool = True) -> Iterator[Hospital]:
+        """Stream all (optionally only active) hospitals, ordered by name."""
+
+    @abstractmethod
+    def find_all_summary(self) -> List[Tuple[int, str, str, str, int]]:
+        """Return ``(id, hospital_name, city, state, total_beds)`` for active hospitals."""
+
+    @abstractmethod
+    def exists_any(self) -> bool:
+        """Return True when at least one hospital row exists (active or not)."""
+
     @abstractmethod
     def exists_registration_number(self, reg_no: str, exclude_id: Optional[int] = None) -> bool:
         """Check uniqueness of a registration number."""
@@ -67,52 +107,31 @@ class IHospitalRepository(ABC):
 # SQLite Implementation
 # ---------------------------------------------------------------------------
 
-_INSERT_SQL = """
-INSERT INTO hospitals (
-    hospital_name, registration_number, hospital_type, specialization_type,
-    address_line1, address_line2, city, state, pin_code, country,
-    phone_primary, phone_alternate, emergency_contact, email, website,
-    total_beds, icu_beds, operation_theaters,
-    administrator_name, license_number, accreditation, established_year,
-    gstin, is_active
-) VALUES (
-    :hospital_name, :registration_number, :hospital_type, :specialization_type,
-    :address_line1, :address_line2, :city, :state, :pin_code, :country,
-    :phone_primary, :phone_alternate, :emergency_contact, :email, :website,
-    :total_beds, :icu_beds, :operation_theaters,
-    :administrator_name, :license_number, :accreditation, :established_year,
-    :gstin, :is_active
+# Writable columns in binding order; ``is_active`` is appended separately
+# because it is stored as 0/1.
+_HOSPITAL_FIELDS = (
+    "hospital_name", "registration_number", "hospital_type", "specialization_type",
+    "address_line1", "address_line2", "city", "state", "pin_code", "country",
+    "phone_primary", "phone_alternate", "emergency_contact", "email", "website",
+    "total_beds", "icu_beds", "operation_theaters",
+    "administrator_name", "license_number", "accreditation", "established_year",
+    "gstin",
+)
+_get_hospital_tuple = attrgetter(*_HOSPITAL_FIELDS)
+
+_INSERT_SQL = (
+    "INSERT INTO hospitals ("
+    + ", ".join(_HOSPITAL_FIELDS)
+    + ", is_active) VALUES ("
+    + ", ".join("?" * (len(_HOSPITAL_FIELDS) + 1))
+    + ")"
 )
-"""
 
-_UPDATE_SQL = """
-UPDATE hospitals SET
-    hospital_name       = :hospital_name,
-    registration_number = :registration_number,
-    hospital_type       = :hospital_type,
-    specialization_type = :specialization_type,
-    address_line1       = :address_line1,
-    address_line2       = :address_line2,
-    city                = :city,
-    state               = :state,
-    pin_code            = :pin_code,
-    country             = :country,
-    phone_primary       = :phone_primary,
-    phone_alternate     = :phone_alternate,
-    emergency_contact   = :emergency_contact,
-    email               = :email,
-    website             = :website,
-    total_beds          = :total_beds,
-    icu_beds            = :icu_beds,
-    operation_theaters  = :operation_theaters,
-    administrator_name  = :administrator_name,
-    license_number      = :license_number,
-    accreditation       = :accreditation,
-    established_year    = :established_year,
-    gstin               = :gstin,
-    is_active           = :is_active
-WHERE id = :id
-"""
+_UPDATE_SQL = (
+    "UPDATE hospitals SET "
+    + ", ".join(f"{f} = ?" for f in _HOSPITAL_FIELDS)
+    + ", is_active = ? WHERE id = ?"
+)
 
 _SELECT_COLS = """
     id, hospital_name, registration_number, hospital_type, specialization_type,
@@ -123,35 +142,81 @@ _SELECT_COLS = """
     gstin, is_active, created_at, updated_at
 """
 
+# Pre-built statements – sqlite3's statement cache is keyed by the exact SQL
+# string, so every call must hand over the very same text.
+_SQL_FIND_BY_ID = f"SELECT {_SELECT_COLS} FROM hospitals WHERE id = ?"
+_SQL_FIND_BY_REG = f"SELECT {_SELECT_COLS} FROM hospitals WHERE registration_number = ?"
+_SQL_FIND_ALL = f"SELECT {_SELECT_COLS} FROM hospitals ORDER BY hospital_name"
+_SQL_FIND_ALL_ACTIVE = (
+    f"SELECT {_SELECT_COLS} FROM hospitals WHERE is_active = 1 ORDER BY hospital_name"
+)
+_SQL_FIND_ALL_SUMMARY = (
+    "SELECT id, hospital_name, city, state, total_beds FROM hospitals "
+    "WHERE is_active = 1 ORDER BY hospital_name"
+)
+_SQL_EXISTS_ANY = "SELECT EXISTS(SELECT 1 FROM hospitals)"
+_SQL_EXISTS_REG = (
+    "SELECT EXISTS(SELECT 1 FROM hospitals WHERE registration_number = ? LIMIT 1)"
+)
+_SQL_EXISTS_REG_EXCL = (
+    "SELECT EXISTS(SELECT 1 FROM hospitals "
+    "WHERE registration_number = ? AND id != ? LIMIT 1)"
+)
+_SQL_EXISTS_LIC = (
+    "SELECT EXISTS(SELECT 1 FROM hospitals WHERE license_number = ? LIMIT 1)"
+)
+_SQL_EXISTS_LIC_EXCL = (
+    "SELECT EXISTS(SELECT 1 FROM hospitals "
+    "WHERE license_number = ? AND id != ? LIMIT 1)"
+)
+
+
+@lru_cache(maxsize=16)
+def _search_sql(active_only: bool, by_id: bool, by_name: bool, by_city: bool) -> str:
+    """Assemble (once per filter combination) the SQL used by ``search``."""
+    conditions: list[str] = []
+    if active_only:
+        conditions.append("is_active = 1")
+    if by_id:
+        conditions.append("id = ?")
+    if by_name:
+        conditions.append("hospital_name LIKE ?")
+    if by_city:
+        conditions.append("city LIKE ?")
+
+    sql = f"SELECT {_SELECT_COLS} FROM hospitals"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    return sql + " ORDER BY hospital_name"
+
+
+def _hospital_to_params(h: Hospital) -> tuple:
+    """Positional INSERT parameters, in ``_HOSPITAL_FIELDS`` order."""
+    return _get_hospital_tuple(h) + (1 if h.is_active else 0,)
+
+
+# Rows pulled from SQLite per fetchmany() call when streaming results
+_FETCH_BATCH = 200
+
+_UNIQUE_FAILED_PREFIX = "UNIQUE constraint failed: hospitals."
+
 
-def _hospital_to_params(h: Hospital) -> dict:
-    return {
-        "id": h.id,
-        "hospital_name": h.hospital_name,
-        "registration_number": h.registration_number,
-        "hospital_type": h.hospital_type,
-        "specialization_type": h.specialization_type,
-        "address_line1": h.address_line1,
-        "address_line2": h.address_line2,
-        "city": h.city,
-        "state": h.state,
-        "pin_code": h.pin_code,
-        "country": h.country,
-        "phone_primary": h.phone_primary,
-        "phone_alternate": h.phone_alternate,
-        "emergency_contact": h.emergency_contact,
-        "email": h.email,
-        "website": h.website,
-        "total_beds": h.total_beds,
-        "icu_beds": h.icu_beds,
-        "operation_theaters": h.operation_theaters,
-        "administrator_name": h.administrator_name,
-        "license_number": h.license_number,
-        "accreditation": h.accreditation,
-        "established_year": h.established_year,
-        "gstin": h.gstin,
-        "is_active": 1 if h.is_active else 0,
-    }
+def _unique_conflict_field(exc: sqlite3.IntegrityError) -> Optional[str]:
+    """Return the column behind a UNIQUE violation, or None for other errors."""
+    message = str(exc)
+    if message.startswith(_UNIQUE_FAILED_PREFIX):
+        return message[len(_UNIQUE_FAILED_PREFIX):]
+    return None
+
+
+def _rows_to_hospitals(cursor) -> List[Hospital]:
+    """Build Hospitals straight off the cursor, without an intermediate fetchall() list."""
+    out: List[Hospital] = []
+    append = out.append
+    from_row = Hospital.from_row
+    for row in cursor:
+        append(from_row(row))
+    return out
 
 
 class HospitalRepository(IHospitalRepository):
@@ -164,20 +229,53 @@ class HospitalRepository(IHospitalRepository):
     # Write operations
     # ------------------------------------------------------------------
 
-    def add(self, hospital: Hospital) -> Hospital:
+    def add(
+        self, hospital: Hospital, commit: bool = True
+    ) -> Tuple[Hospital, Optional[str]]:
+        """Single INSERT; the UNIQUE indexes do the duplicate detection."""
         conn = self._db.get_connection()
         params = _hospital_to_params(hospital)
-        cursor = conn.execute(_INSERT_SQL, params)
-        conn.commit()
+        try:
+            cursor = conn.execute(_INSERT_SQL, params)
+            if commit:
+                conn.commit()
+        except Exception as exc:
+            if commit:
+                conn.rollback()     # release the write lock the INSERT took
+            field = (
+                _unique_conflict_field(exc)
+                if isinstance(exc, sqlite3.IntegrityError) else None
+            )
+            if field is None:
+                raise
+            return hospital, field
         hospital.id = cursor.lastrowid
-        return hospital
+        return hospital, None
+
+    def add_many(self, hospitals: Iterable[Hospital]) -> None:
+        """
+        Bulk insert via ``executemany``: sqlite3 opens one implicit
+        transaction for the whole batch, so it costs a single commit.
+        Generated ids are not written back to the Hospital objects.
+        """
+        conn = self._db.get_connection()
+        try:
+            conn.executemany(_INSERT_SQL, map(_hospital_to_params, hospitals))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
 
     def update(self, hospital: Hospital) -> Hospital:
         if hospital.id is None:
             raise ValueError("Cannot update a Hospital without an id.")
         conn = self._db.get_connection()
-        conn.execute(_UPDATE_SQL, _hospital_to_params(hospital))
-        conn.commit()
+        try:
+            conn.execute(_UPDATE_SQL, _hospital_to_params(hospital) + (hospital.id,))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
         return hospital
 
     # ------------------------------------------------------------------
@@ -185,29 +283,40 @@ class HospitalRepository(IHospitalRepository):
     # ------------------------------------------------------------------
 
     def find_by_id(self, hospital_id: int) -> Optional[Hospital]:
-        cursor = self._db.execute(
-            f"SELECT {_SELECT_COLS} FROM hospitals WHERE id = ?",
-            (hospital_id,),
-        )
+        cursor = self._db.execute(_SQL_FIND_BY_ID, (hospital_id,))
         row = cursor.fetchone()
         return Hospital.from_row(row) if row else None
 
     def find_by_registration_number(self, reg_no: str) -> Optional[Hospital]:
-        cursor = self._db.execute(
-            f"SELECT {_SELECT_COLS} FROM hospitals WHERE registration_number = ?",
-            (reg_no,),
-        )
+        cursor = self._db.execute(_SQL_FIND_BY_REG, (reg_no,))
         row = cursor.fetchone()
         return Hospital.from_row(row) if row else None
 
     def find_all(self, active_only: bool = True) -> List[Hospital]:
-        sql = f"SELECT {_SELECT_COLS} FROM hospitals"
-        params: tuple = ()
-        if active_only:
-            sql += " WHERE is_active = 1"
-        sql += " ORDER BY hospital_name"
-        cursor = self._db.execute(sql, params)
-        return [Hospital.from_row(row) for row in cursor.fetchall()]
+        sql = _SQL_FIND_ALL_ACTIVE if active_only else _SQL_FIND_ALL
+        cursor = self._db.execute(sql)
+        return _rows_to_hospitals(cursor)
+
+    def iter_all(self, active_only: bool = True) -> Iterator[Hospital]:
+        """Yield hospitals in ``_FETCH_BATCH``-sized chunks as the cursor streams them."""
+        sql = _SQL_FIND_ALL_ACTIVE if active_only else _SQL_FIND_ALL
+        cursor = self._db.execute(sql)
+        from_row = Hospital.from_row
+        while True:
+            rows = cursor.fetchmany(_FETCH_BATCH)
+            if not rows:
+                return
+            for row in rows:
+                yield from_row(row)
+
+    def find_all_summary(self) -> List[Tuple[int, str, str, str, int]]:
+        """
+        Lightweight listing for list views: plain tuples, no Hospital
+        objects and no sqlite3.Row wrappers.
+        """
+        cursor = self._db.get_connection().cursor()
+        cursor.row_factory = None
+        return cursor.execute(_SQL_FIND_ALL_SUMMARY).fetchall()
 
     def search(
         self,
@@ -217,58 +326,38 @@ class HospitalRepository(IHospitalRepository):
         active_only: bool = True,
     ) -> List[Hospital]:
         """Dynamic search using any combination of name / id / city filters."""
-        conditions: list[str] = []
         params: list = []
 
-        if active_only:
-            conditions.append("is_active = 1")
-
         if hospital_id is not None:
-            conditions.append("id = ?")
             params.append(hospital_id)
 
         if name:
-            conditions.append("hospital_name LIKE ?")
             params.append(f"%{name}%")
 
         if city:
-            conditions.append("city LIKE ?")
             params.append(f"%{city}%")
 
-        sql = f"SELECT {_SELECT_COLS} FROM hospitals"
-        if conditions:
-            sql += " WHERE " + " AND ".join(conditions)
-        sql += " ORDER BY hospital_name"
-
+        sql = _search_sql(active_only, hospital_id is not None, bool(name), bool(city))
         cursor = self._db.execute(sql, tuple(params))
-        return [Hospital.from_row(row) for row in cursor.fetchall()]
+        return _rows_to_hospitals(cursor)
 
     # ------------------------------------------------------------------
     # Existence checks
     # ------------------------------------------------------------------
 
+    def exists_any(self) -> bool:
+        return bool(self._db.execute(_SQL_EXISTS_ANY).fetchone()[0])
+
     def exists_registration_number(self, reg_no: str, exclude_id: Optional[int] = None) -> bool:
         if exclude_id is not None:
-            cursor = self._db.execute(
-                "SELECT 1 FROM hospitals WHERE registration_number = ? AND id != ?",
-                (reg_no, exclude_id),
-            )
+            cursor = self._db.execute(_SQL_EXISTS_REG_EXCL, (reg_no, exclude_id))
         else:
-            cursor = self._db.execute(
-                "SELECT 1 FROM hospitals WHERE registration_number = ?",
-                (reg_no,),
-            )
-        return cursor.fetchone() is not None
+            cursor = self._db.execute(_SQL_EXISTS_REG, (reg_no,))
+        return bool(cursor.fetchone()[0])
 
     def exists_license_number(self, license_no: str, exclude_id: Optional[int] = None) -> bool:
         if exclude_id is not None:
-            cursor = self._db.execute(
-                "SELECT 1 FROM hospitals WHERE license_number = ? AND id != ?",
-                (license_no, exclude_id),
-            )
+            cursor = self._db.execute(_SQL_EXISTS_LIC_EXCL, (license_no, exclude_id))
         else:
-            cursor = self._db.execute(
-                "SELECT 1 FROM hospitals WHERE license_number = ?",
-                (license_no,),
-            )
-        return cursor.fetchone() is not None
+            cursor = self._db.execute(_SQL_EXISTS_LIC, (license_no,))
+        return bool(cursor.fetchone()[0])
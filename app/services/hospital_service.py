@@ -9,20 +9,22 @@ concrete database class – maintaining full loose coupling.
 
 from __future__ import annotations
 
-import re
+import string
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Iterator, List, Optional
 
 from app.models.hospital import Hospital
-from app.repositories.hospital_repository import IHospitalRepository
+from app.repositories.hospital_repository import IHospitalRepository, RepositoryError
 
 
 # ---------------------------------------------------------------------------
 # Value object for validation/operation results
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ServiceResult:
     """Carries the outcome of a service operation."""
     success: bool
@@ -38,6 +40,90 @@ class ServiceResult:
         return cls(success=False, message=message, data=None)
 
 
+# ---------------------------------------------------------------------------
+# Validation tables
+# ---------------------------------------------------------------------------
+
+# Mandatory text fields as (attribute, label), checked in this order
+_MANDATORY_FIELDS: tuple[tuple[str, str], ...] = (
+    ("hospital_name",        "Hospital Name"),
+    ("registration_number",  "Registration Number"),
+    ("hospital_type",        "Hospital Type"),
+    ("specialization_type",  "Specialization Type"),
+    ("address_line1",        "Address Line 1"),
+    ("city",                 "City"),
+    ("state",                "State"),
+    ("pin_code",             "PIN Code"),
+    ("country",              "Country"),
+    ("phone_primary",        "Primary Phone"),
+    ("emergency_contact",    "Emergency Contact"),
+    ("email",                "Email"),
+    ("administrator_name",   "Administrator Name"),
+    ("license_number",       "License Number"),
+)
+
+# Labels for UNIQUE columns reported back by the repository on conflict
+_UNIQUE_FIELD_LABELS = {
+    "registration_number": "Registration Number",
+    "license_number":      "License Number",
+}
+
+# Fetches, in one C-level call, every field the database-independent checks
+# read: the mandatory text fields (in table order) followed by the numbers
+_GET_VALIDATED = attrgetter(
+    *(attr for attr, _ in _MANDATORY_FIELDS),
+    "total_beds", "icu_beds", "operation_theaters", "established_year",
+)
+
+
+# ---------------------------------------------------------------------------
+# Format validators (hand-written: the grammars are too small to need regex)
+# ---------------------------------------------------------------------------
+
+_EMAIL_LOCAL_PUNCT = frozenset("_.%+-")
+_EMAIL_DOMAIN_PUNCT = frozenset("_.-")
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+_PIN_CHARS = frozenset(string.ascii_letters + string.digits + "-")
+
+
+def _is_email(s: str) -> bool:
+    """local@domain.tld – word chars plus ``.%+-`` locally, 2+ letter TLD."""
+    local, at, domain = s.partition("@")
+    if not at or not local or "@" in domain:
+        return False
+    host, dot, tld = domain.rpartition(".")
+    if not dot or not host or len(tld) < 2 or not _ASCII_LETTERS.issuperset(tld):
+        return False
+    return all(c.isalnum() or c in _EMAIL_LOCAL_PUNCT for c in local) and all(
+        c.isalnum() or c in _EMAIL_DOMAIN_PUNCT for c in host
+    )
+
+
+def _is_phone(s: str) -> bool:
+    """7-15 digits, optionally starting with +."""
+    if s.startswith("+"):
+        s = s[1:]
+    return 7 <= len(s) <= 15 and s.isdecimal()
+
+
+def _is_pin(s: str) -> bool:
+    """PIN / postal code: 4-10 letters, digits, spaces or hyphens."""
+    # Letters are ASCII only, on purpose: the old re.I pattern also let in
+    # the Kelvin sign (U+212A) and dotless i (U+0131) via case folding.
+    return 4 <= len(s) <= 10 and all(c in _PIN_CHARS or c.isspace() for c in s)
+
+
+def is_integer_text(s: str) -> bool:
+    """
+    True if a (stripped) form value is digits with an optional leading "-".
+
+    Shared by the web and desktop forms.  Negatives pass so that the
+    service's range checks report them; forms ``int()`` would also take
+    (``"+5"``, ``"1_0"``) are refused.
+    """
+    return s.removeprefix("-").isdecimal()
+
+
 # ---------------------------------------------------------------------------
 # Abstract Interface
 # ---------------------------------------------------------------------------
@@ -53,8 +139,8 @@ class IHospitalService(ABC):
         """Retrieve a hospital by primary key."""
 
     @abstractmethod
-    def get_all_hospitals(self) -> List[Hospital]:
-        """Return all active hospitals."""
+    def get_all_hospitals(self) -> Iterator[Hospital]:
+        """Stream all active hospitals (iterate once; ``list()`` it to index)."""
 
     @abstractmethod
     def is_first_run(self) -> bool:
@@ -81,12 +167,13 @@ class IHospitalService(ABC):
 class HospitalService(IHospitalService):
     """Business-logic orchestrator for hospital operations."""
 
-    # Email regex – reasonably permissive
-    _EMAIL_RE = re.compile(r"^[\w.%+\-]+@[\w.\-]+\.[a-zA-Z]{2,}$")
-    # Phone: 7-15 digits, optionally starting with +
-    _PHONE_RE = re.compile(r"^\+?\d{7,15}$")
-    # PIN code: 6 digits (India) or 5–10 alphanumeric
-    _PIN_RE = re.compile(r"^[A-Z0-9\s\-]{4,10}$", re.IGNORECASE)
+    # Format checks as (validator, attribute, failure message)
+    _FIELD_VALIDATORS = (
+        (_is_email, "email",             "Email address format is invalid."),
+        (_is_phone, "phone_primary",     "Primary Phone number format is invalid."),
+        (_is_phone, "emergency_contact", "Emergency Contact format is invalid."),
+        (_is_pin,   "pin_code",          "PIN Code format is invalid."),
+    )
 
     def __init__(self, repository: IHospitalRepository) -> None:
         self._repo = repository
@@ -97,31 +184,34 @@ class HospitalService(IHospitalService):
 
     def register_hospital(self, hospital: Hospital) -> ServiceResult:
         """
-        Validate all mandatory fields, check uniqueness constraints,
-        then delegate persistence to the repository.
+        Validate all mandatory fields, then delegate persistence to the
+        repository.  Uniqueness is enforced by the INSERT itself (UNIQUE
+        indexes), so a registration costs one round trip and cannot race.
         """
-        validation = self._validate(hospital)
+        validation = self._validate(hospital, check_unique=False)
         if not validation.success:
             return validation
 
         try:
-            saved = self._repo.add(hospital)
-            return ServiceResult.ok(
-                f"Hospital '{saved.hospital_name}' registered successfully "
-                f"(ID: {saved.id}).",
-                data=saved,
-            )
-        except Exception as exc:
+            saved, conflict = self._repo.add(hospital)
+        except RepositoryError as exc:
             return ServiceResult.fail(f"Database error: {exc}")
+        if conflict is not None:
+            return self._conflict_result(hospital, conflict)
+        return ServiceResult.ok(
+            f"Hospital '{saved.hospital_name}' registered successfully "
+            f"(ID: {saved.id}).",
+            data=saved,
+        )
 
     def get_hospital(self, hospital_id: int) -> Optional[Hospital]:
         return self._repo.find_by_id(hospital_id)
 
-    def get_all_hospitals(self) -> List[Hospital]:
-        return self._repo.find_all(active_only=True)
+    def get_all_hospitals(self) -> Iterator[Hospital]:
+        return self._repo.iter_all(active_only=True)
 
     def is_first_run(self) -> bool:
-        return len(self._repo.find_all(active_only=False)) == 0
+        return not self._repo.exists_any()
 
     def search_hospitals(
         self,
@@ -145,63 +235,35 @@ class HospitalService(IHospitalService):
                 f"Hospital '{saved.hospital_name}' updated successfully.",
                 data=saved,
             )
-        except Exception as exc:
+        except RepositoryError as exc:
             return ServiceResult.fail(f"Database error: {exc}")
 
     # ------------------------------------------------------------------
     # Validation
     # ------------------------------------------------------------------
 
-    def _validate(self, h: Hospital) -> ServiceResult:
-        """Run all business validation rules; return first failure found."""
-
-        # --- Mandatory text fields ---
-        mandatory: list[tuple[str, str]] = [
-            (h.hospital_name.strip(),        "Hospital Name"),
-            (h.registration_number.strip(),  "Registration Number"),
-            (h.hospital_type.strip(),        "Hospital Type"),
-            (h.specialization_type.strip(),  "Specialization Type"),
-            (h.address_line1.strip(),        "Address Line 1"),
-            (h.city.strip(),                 "City"),
-            (h.state.strip(),                "State"),
-            (h.pin_code.strip(),             "PIN Code"),
-            (h.country.strip(),              "Country"),
-            (h.phone_primary.strip(),        "Primary Phone"),
-            (h.emergency_contact.strip(),    "Emergency Contact"),
-            (h.email.strip(),                "Email"),
-            (h.administrator_name.strip(),   "Administrator Name"),
-            (h.license_number.strip(),       "License Number"),
-        ]
-        for value, label in mandatory:
-            if not value:
-                return ServiceResult.fail(f"{label} is required.")
+    @staticmethod
+    def _conflict_result(h: Hospital, field: str) -> ServiceResult:
+        """Map a UNIQUE-column conflict reported by the repository to a failure."""
+        label = _UNIQUE_FIELD_LABELS.get(field, field)
+        return ServiceResult.fail(f"{label} '{getattr(h, field, '')}' is already in use.")
 
-        # --- Numeric/range validations ---
-        if h.total_beds <= 0:
-            return ServiceResult.fail("Total Beds must be greater than 0.")
-        if h.icu_beds < 0:
-            return ServiceResult.fail("ICU Beds cannot be negative.")
-        if h.icu_beds > h.total_beds:
-            return ServiceResult.fail("ICU Beds cannot exceed Total Beds.")
-        if h.operation_theaters < 0:
-            return ServiceResult.fail("Operation Theaters cannot be negative.")
-        current_year = 2026
-        if not (1800 <= h.established_year <= current_year):
-            return ServiceResult.fail(
-                f"Established Year must be between 1800 and {current_year}."
-            )
+    def _validate(self, h: Hospital, check_unique: bool = True) -> ServiceResult:
+        """
+        Run all business validation rules; return first failure found.
 
-        # --- Format validations ---
-        if not self._EMAIL_RE.match(h.email.strip()):
-            return ServiceResult.fail("Email address format is invalid.")
-        if not self._PHONE_RE.match(h.phone_primary.strip()):
-            return ServiceResult.fail("Primary Phone number format is invalid.")
-        if not self._PHONE_RE.match(h.emergency_contact.strip()):
-            return ServiceResult.fail("Emergency Contact format is invalid.")
-        if not self._PIN_RE.match(h.pin_code.strip()):
-            return ServiceResult.fail("PIN Code format is invalid.")
+        Tier 1 (field rules) is memoised on the tuple of validated values, so
+        resubmitting an unchanged form skips it.  Tier 2 (uniqueness) reads
+        the database and is never cached.  ``check_unique=False`` skips
+        tier 2 for callers that rely on the database constraint instead.
+        """
+        error = self._check_fields(_GET_VALIDATED(h))
+        if error is not None:
+            return ServiceResult.fail(error)
 
         # --- Uniqueness constraints ---
+        if not check_unique:
+            return ServiceResult.ok()
         if self._repo.exists_registration_number(h.registration_number.strip(), h.id):
             return ServiceResult.fail(
                 f"Registration Number '{h.registration_number}' is already in use."
@@ -212,3 +274,43 @@ class HospitalService(IHospitalService):
             )
 
         return ServiceResult.ok()
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _check_fields(values: tuple) -> Optional[str]:
+        """
+        Database-independent rules over ``_GET_VALIDATED`` values.
+
+        Returns the first failure message, or None when every rule passes.
+        Pure function of its input, hence safe to memoise.
+        """
+        n_text = len(_MANDATORY_FIELDS)
+        total_beds, icu_beds, operation_theaters, established_year = values[n_text:]
+
+        # --- Mandatory text fields (stripped lazily, stop at first blank) ---
+        stripped: dict[str, str] = {}
+        for (attr, label), raw in zip(_MANDATORY_FIELDS, values):
+            value = raw.strip()
+            if not value:
+                return f"{label} is required."
+            stripped[attr] = value
+
+        # --- Numeric/range validations ---
+        if total_beds <= 0:
+            return "Total Beds must be greater than 0."
+        if icu_beds < 0:
+            return "ICU Beds cannot be negative."
+        if icu_beds > total_beds:
+            return "ICU Beds cannot exceed Total Beds."
+        if operation_theaters < 0:
+            return "Operation Theaters cannot be negative."
+        current_year = 2026
+        if not (1800 <= established_year <= current_year):
+            return f"Established Year must be between 1800 and {current_year}."
+
+        # --- Format validations ---
+        for is_valid, attr, message in HospitalService._FIELD_VALIDATORS:
+            if not is_valid(stripped[attr]):
+                return message
+
+        return None
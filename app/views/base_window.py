@@ -4,6 +4,9 @@ Base Window – common helpers shared by all HMS windows.
 
 from __future__ import annotations
 
+from functools import lru_cache
+from types import MappingProxyType
+
 import customtkinter as ctk
 
 
@@ -30,6 +33,33 @@ COLOR_WARN       = "#E65100"
 COLOR_SECTION_BG = "#E3F2FD"      # light-blue section strip
 COLOR_CARD_BG    = "#F5F5F5"
 
+# Fixed keyword arguments shared by the widget factories (read-only).
+# Fonts are passed separately via get_font() as they need a live Tk root.
+_SECTION_LABEL_KW = MappingProxyType({
+    "fg_color": COLOR_SECTION_BG,
+    "text_color": COLOR_ACCENT,
+    "anchor": "w",
+    "corner_radius": 4,
+    "height": 32,
+})
+_ENTRY_KW  = MappingProxyType({"height": 36, "corner_radius": 6})
+_COMBO_KW  = MappingProxyType({"height": 36, "corner_radius": 6, "state": "readonly"})
+_BUTTON_KW = MappingProxyType({"height": 40, "corner_radius": 8})
+
+# CTkFont objects built from the FONT_* tuples on first use.  Fonts belong to
+# a Tk root, so the cache is cleared whenever a new window (root) is created.
+_font_cache: dict[tuple, ctk.CTkFont] = {}
+
+
+def get_font(spec: tuple) -> ctk.CTkFont:
+    """Return a shared CTkFont for a ``(family, size[, weight])`` tuple."""
+    font = _font_cache.get(spec)
+    if font is None:
+        family, size, *weight = spec
+        font = ctk.CTkFont(family=family, size=size, weight=weight[0] if weight else "normal")
+        _font_cache[spec] = font
+    return font
+
 
 def apply_theme() -> None:
     ctk.set_appearance_mode(APP_APPEARANCE)
@@ -48,6 +78,7 @@ class BaseWindow(ctk.CTk):
 
     def __init__(self, title: str = "HMS", width: int = 1200, height: int = 750) -> None:
         super().__init__()
+        _font_cache.clear()
         self.title(title)
         self._centre(width, height)
         self.resizable(True, True)
@@ -73,42 +104,25 @@ class BaseWindow(ctk.CTk):
     def make_section_label(parent, text: str) -> ctk.CTkLabel:
         """Renders a horizontal section-header strip."""
         return ctk.CTkLabel(
-            parent,
-            text=f"  {text}",
-            font=FONT_HEADER,
-            fg_color=COLOR_SECTION_BG,
-            text_color=COLOR_ACCENT,
-            anchor="w",
-            corner_radius=4,
-            height=32,
+            parent, text=f"  {text}", font=get_font(FONT_HEADER), **_SECTION_LABEL_KW
         )
 
     @staticmethod
     def make_label(parent, text: str, required: bool = False) -> ctk.CTkLabel:
         lbl = f"{text} *" if required else text
-        return ctk.CTkLabel(parent, text=lbl, font=FONT_LABEL, anchor="w")
+        return ctk.CTkLabel(parent, text=lbl, font=get_font(FONT_LABEL), anchor="w")
 
     @staticmethod
     def make_entry(parent, placeholder: str = "", width: int = 260) -> ctk.CTkEntry:
         return ctk.CTkEntry(
-            parent,
-            placeholder_text=placeholder,
-            font=FONT_INPUT,
-            width=width,
-            height=36,
-            corner_radius=6,
+            parent, placeholder_text=placeholder, width=width,
+            font=get_font(FONT_INPUT), **_ENTRY_KW,
         )
 
     @staticmethod
     def make_combo(parent, values: list, width: int = 260) -> ctk.CTkComboBox:
         return ctk.CTkComboBox(
-            parent,
-            values=values,
-            font=FONT_INPUT,
-            width=width,
-            height=36,
-            corner_radius=6,
-            state="readonly",
+            parent, values=values, width=width, font=get_font(FONT_INPUT), **_COMBO_KW
         )
 
     @staticmethod
@@ -123,12 +137,11 @@ class BaseWindow(ctk.CTk):
             parent,
             text=text,
             command=command,
-            font=FONT_BUTTON,
             fg_color=color,
             hover_color=_darken(color),
             width=width,
-            height=40,
-            corner_radius=8,
+            font=get_font(FONT_BUTTON),
+            **_BUTTON_KW,
         )
 
 
@@ -142,7 +155,7 @@ class TopHeaderBar(ctk.CTkFrame):
         ctk.CTkLabel(
             self,
             text="🏥  " + title,
-            font=FONT_TITLE,
+            font=get_font(FONT_TITLE),
             text_color=COLOR_HEADER_FG,
         ).pack(side="left", padx=20, pady=10)
 
@@ -150,7 +163,7 @@ class TopHeaderBar(ctk.CTkFrame):
             ctk.CTkLabel(
                 self,
                 text=subtitle,
-                font=FONT_SMALL,
+                font=get_font(FONT_SMALL),
                 text_color="#BBDEFB",
             ).pack(side="left", padx=6)
 
@@ -159,13 +172,14 @@ class TopHeaderBar(ctk.CTkFrame):
 # Helpers
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=64)
 def _darken(hex_color: str) -> str:
-    """Return a slightly darker shade of the given hex colour."""
+    """Return a slightly darker shade (80 %) of the given ``#RRGGBB`` colour."""
+    if len(hex_color) < 7:
+        return hex_color
     try:
-        r = int(hex_color[1:3], 16)
-        g = int(hex_color[3:5], 16)
-        b = int(hex_color[5:7], 16)
-        factor = 0.80
-        return f"#{int(r*factor):02X}{int(g*factor):02X}{int(b*factor):02X}"
-    except Exception:
+        v = int(hex_color[1:7], 16)
+    except ValueError:
         return hex_color
+    r, g, b = (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF
+    return "#%02X%02X%02X" % (r * 4 // 5, g * 4 // 5, b * 4 // 5)
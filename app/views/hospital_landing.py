@@ -24,6 +24,8 @@ it stays completely decoupled from the persistence layer.
 from __future__ import annotations
 
 import tkinter as tk
+from functools import partial
+from types import SimpleNamespace
 from typing import Callable, Optional
 
 import customtkinter as ctk
@@ -45,6 +47,28 @@ from app.views.base_window import (
 )
 
 
+# ---------------------------------------------------------------------------
+# Pre-formatted display strings
+# ---------------------------------------------------------------------------
+
+def _display_strings(h: Hospital) -> SimpleNamespace:
+    """Format every derived label text once per window, shared by all panels."""
+    return SimpleNamespace(
+        beds=str(h.total_beds),
+        icu=str(h.icu_beds),
+        ots=str(h.operation_theaters),
+        year=str(h.established_year),
+        address=f"{h.address_line1}, {h.city}, {h.state} – {h.pin_code}",
+        welcome=f"Welcome to {h.hospital_name}",
+        header_title=f"🏥  {h.hospital_name}",
+        header_meta=(
+            f"Reg. No: {h.registration_number}   |   "
+            f"{h.city}, {h.state}   |   "
+            f"{h.hospital_type}"
+        ),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Sidebar navigation item
 # ---------------------------------------------------------------------------
@@ -85,9 +109,10 @@ class _NavButton(ctk.CTkButton):
 class _WelcomePanel(ctk.CTkFrame):
     """Dashboard / welcome panel shown by default."""
 
-    def __init__(self, parent, hospital: Hospital) -> None:
+    def __init__(self, parent, hospital: Hospital, display: SimpleNamespace) -> None:
         super().__init__(parent, fg_color="#F0F4F8", corner_radius=0)
         self._hospital = hospital
+        self._display = display
         self._build()
 
     def _build(self) -> None:
@@ -96,7 +121,7 @@ class _WelcomePanel(ctk.CTkFrame):
         # -- Page title --
         ctk.CTkLabel(
             self,
-            text=f"Welcome to {self._hospital.hospital_name}",
+            text=self._display.welcome,
             font=("Segoe UI", 20, "bold"),
             text_color=COLOR_ACCENT,
             anchor="w",
@@ -116,10 +141,11 @@ class _WelcomePanel(ctk.CTkFrame):
         stats_frame.grid_columnconfigure((0, 1, 2, 3), weight=1)
 
         h = self._hospital
+        d = self._display
         stats = [
-            ("🛏️", "Total Beds", str(h.total_beds), "#1565C0"),
-            ("🏥", "ICU Beds",   str(h.icu_beds),   "#6A1B9A"),
-            ("⚕️",  "OTs",        str(h.operation_theaters), "#00695C"),
+            ("🛏️", "Total Beds", d.beds, "#1565C0"),
+            ("🏥", "ICU Beds",   d.icu,  "#6A1B9A"),
+            ("⚕️",  "OTs",        d.ots,  "#00695C"),
             ("📋", "Type",       h.hospital_type,    "#BF360C"),
         ]
         for col, (icon, label, value, color) in enumerate(stats):
@@ -132,7 +158,7 @@ class _WelcomePanel(ctk.CTkFrame):
             corner_radius=10,
         )
         info_card.grid(row=3, column=0, padx=30, pady=(0, 24), sticky="ew")
-        info_card.grid_columnconfigure((0, 1), weight=1)
+        info_card.grid_columnconfigure(1, weight=1)
 
         ctk.CTkLabel(
             info_card,
@@ -150,24 +176,25 @@ class _WelcomePanel(ctk.CTkFrame):
             ("License Number",         h.license_number),
             ("Specialization",         h.specialization_type),
             ("Accreditation",          h.accreditation),
-            ("Established",            str(h.established_year)),
+            ("Established",            d.year),
             ("Administrator",          h.administrator_name),
-            ("Address",                f"{h.address_line1}, {h.city}, {h.state} – {h.pin_code}"),
+            ("Address",                d.address),
             ("Primary Phone",          h.phone_primary),
             ("Emergency Contact",      h.emergency_contact),
             ("Email",                  h.email),
         ]
+        # Labels sit directly in the card; the row stripe comes from their own
+        # background, so no per-row container frame is needed.
         for idx, (lbl, val) in enumerate(detail_rows):
             bg = "#F5F5F5" if idx % 2 == 0 else "white"
-            row_frame = ctk.CTkFrame(info_card, fg_color=bg, corner_radius=0, height=32)
-            row_frame.grid(row=idx + 1, column=0, columnspan=2, sticky="ew", padx=16, pady=0)
-            row_frame.grid_columnconfigure(1, weight=1)
-            ctk.CTkLabel(row_frame, text=f"{lbl}:", font=("Segoe UI", 11, "bold"),
-                         text_color="#37474F", anchor="w", width=180).grid(
-                row=0, column=0, padx=(8, 4), pady=4, sticky="w")
-            ctk.CTkLabel(row_frame, text=val, font=("Segoe UI", 11),
-                         text_color="#546E7A", anchor="w").grid(
-                row=0, column=1, padx=(0, 8), pady=4, sticky="w")
+            ctk.CTkLabel(info_card, text=f"{lbl}:", font=("Segoe UI", 11, "bold"),
+                         text_color="#37474F", fg_color=bg, corner_radius=0,
+                         anchor="w", width=180, height=32, padx=8).grid(
+                row=idx + 1, column=0, padx=(16, 0), pady=0, sticky="ew")
+            ctk.CTkLabel(info_card, text=val, font=("Segoe UI", 11),
+                         text_color="#546E7A", fg_color=bg, corner_radius=0,
+                         anchor="w", height=32, padx=4).grid(
+                row=idx + 1, column=1, padx=(0, 16), pady=0, sticky="ew")
 
         ctk.CTkLabel(info_card, text="").grid(row=len(detail_rows) + 1, column=0, pady=6)
 
@@ -191,72 +218,79 @@ class _WelcomePanel(ctk.CTkFrame):
                      text_color="#78909C").place(relx=0.42, rely=0.62)
 
 
-class _OPDPanel(ctk.CTkFrame):
-    """OPD (Out-Patient Department) placeholder panel."""
-
-    def __init__(self, parent, hospital: Hospital) -> None:
-        super().__init__(parent, fg_color="#F0F4F8", corner_radius=0)
-        self._build(hospital)
-
-    def _build(self, hospital: Hospital) -> None:
-        ctk.CTkLabel(
-            self,
-            text="📋  Out-Patient Department (OPD)",
-            font=("Segoe UI", 18, "bold"),
-            text_color=COLOR_ACCENT,
-        ).pack(pady=(60, 16), padx=40, anchor="w")
-
-        ctk.CTkLabel(
-            self,
-            text=(
-                f"OPD module for  {hospital.hospital_name}  is coming in the next phase.\n\n"
-                "This section will include:\n"
-                "  •  Patient Registration & Lookup\n"
-                "  •  Appointment Scheduling\n"
-                "  •  Doctor Consultation Queue\n"
-                "  •  Prescription & Diagnosis Entry\n"
-                "  •  Billing & Receipts"
-            ),
-            font=("Segoe UI", 13),
-            text_color="#455A64",
-            justify="left",
-        ).pack(pady=12, padx=60, anchor="w")
-
-        _coming_soon_badge(self)
-
-
-class _IPDPanel(ctk.CTkFrame):
-    """IPD (In-Patient Department) placeholder panel."""
-
-    def __init__(self, parent, hospital: Hospital) -> None:
+# Per-section content for the Phase-2 placeholder panels:
+#   key -> (title, module short name, accent colour, planned features)
+_PLACEHOLDER_SPECS: dict[str, tuple[str, str, str, tuple[str, ...]]] = {
+    "opd": (
+        "📋  Out-Patient Department (OPD)",
+        "OPD",
+        COLOR_ACCENT,
+        (
+            "Patient Registration & Lookup",
+            "Appointment Scheduling",
+            "Doctor Consultation Queue",
+            "Prescription & Diagnosis Entry",
+            "Billing & Receipts",
+        ),
+    ),
+    "ipd": (
+        "🏥  In-Patient Department (IPD)",
+        "IPD",
+        "#6A1B9A",
+        (
+            "Admission & Discharge Management",
+            "Bed / Ward Allocation",
+            "ICU & Operation Theater Scheduling",
+            "Nursing Notes & Care Plans",
+            "Discharge Summary & Billing",
+        ),
+    ),
+}
+
+
+class _PlaceholderPanel(ctk.CTkFrame):
+    """'Coming soon' panel for a department module planned for Phase 2."""
+
+    def __init__(
+        self,
+        parent,
+        hospital: Hospital,
+        title: str,
+        module: str,
+        color: str,
+        bullets: tuple[str, ...],
+    ) -> None:
         super().__init__(parent, fg_color="#F0F4F8", corner_radius=0)
-        self._build(hospital)
+        self._build(hospital, title, module, color, bullets)
 
-    def _build(self, hospital: Hospital) -> None:
+    def _build(
+        self,
+        hospital: Hospital,
+        title: str,
+        module: str,
+        color: str,
+        bullets: tuple[str, ...],
+    ) -> None:
         ctk.CTkLabel(
             self,
-            text="🏥  In-Patient Department (IPD)",
+            text=title,
             font=("Segoe UI", 18, "bold"),
-            text_color="#6A1B9A",
+            text_color=color,
         ).pack(pady=(60, 16), padx=40, anchor="w")
 
+        features = "".join(f"\n  •  {item}" for item in bullets)
         ctk.CTkLabel(
             self,
             text=(
-                f"IPD module for  {hospital.hospital_name}  is coming in the next phase.\n\n"
-                "This section will include:\n"
-                "  •  Admission & Discharge Management\n"
-                "  •  Bed / Ward Allocation\n"
-                "  •  ICU & Operation Theater Scheduling\n"
-                "  •  Nursing Notes & Care Plans\n"
-                "  •  Discharge Summary & Billing"
+                f"{module} module for  {hospital.hospital_name}  is coming in the next phase.\n\n"
+                f"This section will include:{features}"
             ),
             font=("Segoe UI", 13),
             text_color="#455A64",
             justify="left",
         ).pack(pady=12, padx=60, anchor="w")
 
-        _coming_soon_badge(self, color="#6A1B9A")
+        _coming_soon_badge(self, color=color)
 
 
 def _coming_soon_badge(parent: ctk.CTkFrame, color: str = COLOR_ACCENT) -> None:
@@ -290,10 +324,17 @@ class HospitalLandingPage(BaseWindow):
             height=750,
         )
         self._hospital = hospital
+        self._display = _display_strings(hospital)
         self._active_section: Optional[str] = None
         self._nav_buttons: dict[str, _NavButton] = {}
+        self._panels: dict[str, ctk.CTkFrame] = {}
+
+        # Build while hidden so geometry settles in one pass before first paint
+        self.withdraw()
         self._build_ui()
         self._navigate("dashboard")
+        self.update_idletasks()
+        self.deiconify()
 
     # ==================================================================
     # UI Construction
@@ -311,25 +352,21 @@ class HospitalLandingPage(BaseWindow):
 
         ctk.CTkLabel(
             header,
-            text=f"🏥  {self._hospital.hospital_name}",
+            text=self._display.header_title,
             font=("Segoe UI", 18, "bold"),
             text_color=COLOR_HEADER_FG,
         ).grid(row=0, column=0, padx=20, pady=14, sticky="w")
 
         ctk.CTkLabel(
             header,
-            text=(
-                f"Reg. No: {self._hospital.registration_number}   |   "
-                f"{self._hospital.city}, {self._hospital.state}   |   "
-                f"{self._hospital.hospital_type}"
-            ),
+            text=self._display.header_meta,
             font=("Segoe UI", 10),
             text_color="#BBDEFB",
         ).grid(row=0, column=1, padx=16, sticky="w")
 
         ctk.CTkLabel(
             header,
-            text=f"{self._hospital.specialization_type}",
+            text=self._hospital.specialization_type,
             font=("Segoe UI", 10, "bold"),
             text_color="#E3F2FD",
         ).grid(row=0, column=2, padx=20, sticky="e")
@@ -353,7 +390,7 @@ class HospitalLandingPage(BaseWindow):
             ("IPD",        "🏥", "ipd"),
         ]
         for label, icon, key in nav_items:
-            btn = _NavButton(sidebar, label, icon, command=lambda k=key: self._navigate(k))
+            btn = _NavButton(sidebar, label, icon, command=partial(self._navigate, key))
             btn.pack(fill="x")
             self._nav_buttons[key] = btn
 
@@ -369,8 +406,9 @@ class HospitalLandingPage(BaseWindow):
             text_color="#78909C",
         ).pack(pady=(0, 4), padx=16, anchor="w")
 
-        _NavButton(sidebar, "Hospital Info", "ℹ️", command=lambda: self._navigate("info")).pack(fill="x")
-        self._nav_buttons["info"] = sidebar.winfo_children()[-1]
+        info_btn = _NavButton(sidebar, "Hospital Info", "ℹ️", command=partial(self._navigate, "info"))
+        info_btn.pack(fill="x")
+        self._nav_buttons["info"] = info_btn
 
         # Footer
         ctk.CTkLabel(
@@ -400,18 +438,24 @@ class HospitalLandingPage(BaseWindow):
         for key, btn in self._nav_buttons.items():
             btn.set_active(key == section)
 
-        # Destroy previous panel
+        # Hide (not destroy) the previous panel so it can be shown again
         if self._current_panel:
-            self._current_panel.destroy()
-
-        # Build new panel
-        panel_map = {
-            "dashboard": lambda: _WelcomePanel(self._content_area, self._hospital),
-            "opd":       lambda: _OPDPanel(self._content_area, self._hospital),
-            "ipd":       lambda: _IPDPanel(self._content_area, self._hospital),
-            "info":      lambda: _WelcomePanel(self._content_area, self._hospital),
-        }
-        builder = panel_map.get(section, panel_map["dashboard"])
-        self._current_panel = builder()
-        self._current_panel.grid(row=0, column=0, sticky="nsew")
+            self._current_panel.grid_remove()
+
+        # Reuse the cached panel, building it on first visit.  "info" shows
+        # the same welcome panel as "dashboard", so both share one instance.
+        cache_key = "dashboard" if section in ("dashboard", "info") else section
+        panel = self._panels.get(cache_key)
+        if panel is None:
+            panel = self._build_panel(cache_key)
+            self._panels[cache_key] = panel
+        panel.grid(row=0, column=0, sticky="nsew")
+        self._current_panel = panel
         self._active_section = section
+
+    def _build_panel(self, section: str) -> ctk.CTkFrame:
+        spec = _PLACEHOLDER_SPECS.get(section)
+        if spec is not None:
+            return _PlaceholderPanel(self._content_area, self._hospital, *spec)
+        # "dashboard", "info" and any unknown key show the welcome panel
+        return _WelcomePanel(self._content_area, self._hospital, self._display)
@@ -12,7 +12,9 @@ it receives an IHospitalService instance via constructor injection.
 
 from __future__ import annotations
 
+import queue
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import messagebox
 from datetime import datetime
 from typing import Callable, Optional
@@ -26,12 +28,13 @@ from app.models.hospital import (
     ACCREDITATION_OPTIONS,
     INDIA_STATES,
 )
-from app.services.hospital_service import IHospitalService
+from app.services.hospital_service import IHospitalService, is_integer_text
 from app.views.base_window import (
     BaseWindow,
     TopHeaderBar,
     FONT_HEADER,
     FONT_LABEL,
+    FONT_INPUT,
     FONT_SMALL,
     FONT_BUTTON,
     COLOR_ACCENT,
@@ -39,6 +42,80 @@ from app.views.base_window import (
     COLOR_ERROR,
     COLOR_SECTION_BG,
     COLOR_CARD_BG,
+    get_font,
+)
+
+
+# How often (ms) the Tk thread checks for a finished save
+_POLL_MS = 50
+
+# Free-text entries read by _collect, as (Hospital field, widget attribute)
+_TEXT_FIELDS = (
+    ("hospital_name",       "_e_name"),
+    ("registration_number", "_e_reg"),
+    ("established_year",    "_e_est_year"),
+    ("gstin",               "_e_gstin"),
+    ("address_line1",       "_e_addr1"),
+    ("address_line2",       "_e_addr2"),
+    ("city",                "_e_city"),
+    ("pin_code",            "_e_pin"),
+    ("country",             "_e_country"),
+    ("phone_primary",       "_e_phone1"),
+    ("phone_alternate",     "_e_phone2"),
+    ("emergency_contact",   "_e_emergency"),
+    ("email",               "_e_email"),
+    ("website",             "_e_website"),
+    ("total_beds",          "_e_beds"),
+    ("icu_beds",            "_e_icu"),
+    ("operation_theaters",  "_e_ot"),
+    ("administrator_name",  "_e_admin"),
+    ("license_number",      "_e_license"),
+)
+_FIELD_NAMES = tuple(name for name, _ in _TEXT_FIELDS)
+_OPTIONAL_FIELDS = ("address_line2", "phone_alternate", "website", "gstin")
+_INT_FIELDS = (
+    ("total_beds",         "Total Beds"),
+    ("icu_beds",           "ICU Beds"),
+    ("operation_theaters", "Operation Theaters"),
+    ("established_year",   "Established Year"),
+)
+
+# Form layout, in display order.  Fields flow two per row (a span of 3
+# fills the row); a section banner always starts a new row.
+_REQ = {"required": True}
+_FORM_SCHEMA = (
+    ("section", "1.  Hospital Identity"),
+    ("field", "Hospital Name",            "_e_name",      _REQ),
+    ("field", "Registration No.",         "_e_reg",       _REQ),
+    ("combo", "Hospital Type",            "_cb_type",     {"values": HOSPITAL_TYPES, "required": True}),
+    ("combo", "Specialization",           "_cb_spec",     {"values": SPECIALIZATION_TYPES, "required": True}),
+    ("field", "Established Year",         "_e_est_year",  {"required": True, "placeholder": "e.g. 1995"}),
+    ("combo", "Accreditation",            "_cb_accr",     {"values": ACCREDITATION_OPTIONS}),
+    ("field", "GSTIN",                    "_e_gstin",     {"placeholder": "Optional"}),
+
+    ("section", "2.  Address & Location"),
+    ("field", "Address Line 1",           "_e_addr1",     {"required": True, "span": 3}),
+    ("field", "Address Line 2",           "_e_addr2",     {"span": 3, "placeholder": "Optional"}),
+    ("field", "City",                     "_e_city",      _REQ),
+    ("combo", "State",                    "_cb_state",    {"values": INDIA_STATES, "required": True}),
+    ("field", "PIN Code",                 "_e_pin",       {"required": True, "placeholder": "e.g. 400001"}),
+    ("field", "Country",                  "_e_country",   _REQ),
+
+    ("section", "3.  Contact Information"),
+    ("field", "Primary Phone",            "_e_phone1",    {"required": True, "placeholder": "+91XXXXXXXXXX"}),
+    ("field", "Alternate Phone",          "_e_phone2",    {"placeholder": "Optional"}),
+    ("field", "Emergency Contact",        "_e_emergency", {"required": True, "placeholder": "+91XXXXXXXXXX"}),
+    ("field", "Email Address",            "_e_email",     {"required": True, "placeholder": "admin@hospital.com"}),
+    ("field", "Website",                  "_e_website",   {"placeholder": "https://www.hospital.com (Optional)"}),
+
+    ("section", "4.  Capacity & Infrastructure"),
+    ("field", "Total Beds",               "_e_beds",      {"required": True, "placeholder": "e.g. 200"}),
+    ("field", "ICU Beds",                 "_e_icu",       {"placeholder": "e.g. 20"}),
+    ("field", "Operation Theaters",       "_e_ot",        {"placeholder": "e.g. 5"}),
+
+    ("section", "5.  Administration & Licensing"),
+    ("field", "Administrator / CEO Name", "_e_admin",     _REQ),
+    ("field", "License Number",           "_e_license",   _REQ),
 )
 
 
@@ -57,6 +134,12 @@ class HospitalRegistrationWindow(BaseWindow):
         )
         self._service = hospital_service
         self._on_success = on_success
+        self._saving = False                       # a save is in flight
+        # One long-lived worker runs the saves (and so holds a single SQLite
+        # connection); finished futures come back through a queue that the
+        # Tk thread polls, since Tk may only be touched from its own thread.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hms-register")
+        self._results: "queue.Queue[Future]" = queue.Queue()
 
         self._build_ui()
 
@@ -101,7 +184,7 @@ class HospitalRegistrationWindow(BaseWindow):
         status_bar = ctk.CTkLabel(
             self,
             textvariable=self._status_var,
-            font=FONT_SMALL,
+            font=get_font(FONT_SMALL),
             height=26,
             fg_color="#E8EAF6",
             anchor="w",
@@ -125,89 +208,60 @@ class HospitalRegistrationWindow(BaseWindow):
         ctk.CTkLabel(
             parent,
             text="Fields marked with  *  are mandatory",
-            font=FONT_SMALL,
+            font=get_font(FONT_SMALL),
             text_color="#757575",
         ).grid(row=row + 1, column=0, columnspan=4, padx=20, pady=(0, 16), sticky="w")
         row += 2
 
         # ==============================================================
-        # SECTION 1 – Identity
-        # ==============================================================
-        row = self._section(parent, row, "1.  Hospital Identity")
-
-        self._e_name = self._field(parent, row, 0, "Hospital Name", required=True)
-        self._e_reg   = self._field(parent, row, 2, "Registration No.", required=True)
-        row += 2
-
-        self._cb_type = self._combo_field(parent, row, 0, "Hospital Type", HOSPITAL_TYPES, required=True)
-        self._cb_spec = self._combo_field(parent, row, 2, "Specialization", SPECIALIZATION_TYPES, required=True)
-        row += 2
-
-        self._e_est_year = self._field(parent, row, 0, "Established Year", required=True, placeholder="e.g. 1995")
-        self._cb_accr    = self._combo_field(parent, row, 2, "Accreditation", ACCREDITATION_OPTIONS)
-        row += 2
-
-        self._e_gstin = self._field(parent, row, 0, "GSTIN", placeholder="Optional")
-        row += 2
-
-        # ==============================================================
-        # SECTION 2 – Address
+        # Sections and fields, laid out from _FORM_SCHEMA.  Only the first
+        # section is built now; the rest follow one per idle callback, so
+        # the window paints before the off-screen widgets exist.
         # ==============================================================
-        row = self._section(parent, row, "2.  Address & Location")
-
-        self._e_addr1 = self._field(parent, row, 0, "Address Line 1", required=True, span=3)
-        row += 2
-        self._e_addr2 = self._field(parent, row, 0, "Address Line 2", span=3, placeholder="Optional")
-        row += 2
-
-        self._e_city    = self._field(parent, row, 0, "City", required=True)
-        self._cb_state  = self._combo_field(parent, row, 2, "State", INDIA_STATES, required=True)
-        row += 2
+        steps = self._layout_form(parent, row)
+        next(steps)
+        self.after_idle(self._build_next_section, steps)
+
+    def _build_next_section(self, steps) -> None:
+        if next(steps, None) is not None:
+            self.after_idle(self._build_next_section, steps)
+
+    def _layout_form(self, parent: ctk.CTkFrame, row: int):
+        """Create the form widgets, yielding True after each section."""
+        first_row, col = row, 0
+        combo_defaults = []
+        for kind, label, *spec in _FORM_SCHEMA:
+            if kind == "section":
+                if col:
+                    row, col = row + 2, 0
+                if row > first_row:
+                    yield True
+                row = self._section(parent, row, label)
+                continue
+
+            attr, opts = spec
+            if kind == "combo":
+                widget = self._combo_field(parent, row, col, label, **opts)
+                combo_defaults.append((widget, opts["values"][0]))
+            else:
+                widget = self._field(parent, row, col, label, **opts)
+            setattr(self, attr, widget)
+
+            col += 2 * opts.get("span", 1)
+            if col >= 4:
+                row, col = row + 2, 0
+        if col:
+            row += 2
 
-        self._e_pin     = self._field(parent, row, 0, "PIN Code", required=True, placeholder="e.g. 400001")
-        self._e_country = self._field(parent, row, 2, "Country", required=True)
         self._e_country.insert(0, "India")
-        row += 2
-
-        # ==============================================================
-        # SECTION 3 – Contact
-        # ==============================================================
-        row = self._section(parent, row, "3.  Contact Information")
-
-        self._e_phone1    = self._field(parent, row, 0, "Primary Phone", required=True, placeholder="+91XXXXXXXXXX")
-        self._e_phone2    = self._field(parent, row, 2, "Alternate Phone", placeholder="Optional")
-        row += 2
-
-        self._e_emergency = self._field(parent, row, 0, "Emergency Contact", required=True, placeholder="+91XXXXXXXXXX")
-        self._e_email     = self._field(parent, row, 2, "Email Address", required=True, placeholder="admin@hospital.com")
-        row += 2
-
-        self._e_website = self._field(parent, row, 0, "Website", placeholder="https://www.hospital.com (Optional)")
-        row += 2
-
-        # ==============================================================
-        # SECTION 4 – Capacity
-        # ==============================================================
-        row = self._section(parent, row, "4.  Capacity & Infrastructure")
-
-        self._e_beds     = self._field(parent, row, 0, "Total Beds", required=True, placeholder="e.g. 200")
-        self._e_icu      = self._field(parent, row, 2, "ICU Beds", placeholder="e.g. 20")
-        row += 2
-
-        self._e_ot = self._field(parent, row, 0, "Operation Theaters", placeholder="e.g. 5")
-        row += 2
-
-        # ==============================================================
-        # SECTION 5 – Administration & Licensing
-        # ==============================================================
-        row = self._section(parent, row, "5.  Administration & Licensing")
 
-        self._e_admin   = self._field(parent, row, 0, "Administrator / CEO Name", required=True)
-        self._e_license = self._field(parent, row, 2, "License Number", required=True)
-        row += 2
+        # Fixed-order entry list shared by _collect and _clear_form
+        self._text_entries = tuple(getattr(self, attr) for _, attr in _TEXT_FIELDS)
+        self._combo_defaults = tuple(combo_defaults)
 
         # ==============================================================
-        # Action Buttons
+        # Action Buttons (created last, so the form is complete before
+        # it can be submitted or cleared)
         # ==============================================================
         btn_frame = ctk.CTkFrame(parent, fg_color="transparent")
         btn_frame.grid(row=row, column=0, columnspan=4, pady=28, padx=20, sticky="e")
@@ -216,7 +270,7 @@ class HospitalRegistrationWindow(BaseWindow):
             btn_frame,
             text="Clear Form",
             command=self._clear_form,
-            font=FONT_BUTTON,
+            font=get_font(FONT_BUTTON),
             fg_color="#616161",
             hover_color="#424242",
             width=130,
@@ -265,13 +319,13 @@ class HospitalRegistrationWindow(BaseWindow):
     ) -> ctk.CTkEntry:
         col_span = span * 2  # each logical column takes 2 grid columns
         lbl_text = f"{label} *" if required else label
-        ctk.CTkLabel(parent, text=lbl_text, font=FONT_LABEL, anchor="w").grid(
+        ctk.CTkLabel(parent, text=lbl_text, font=get_font(FONT_LABEL), anchor="w").grid(
             row=row, column=col, columnspan=col_span, padx=(16, 4), pady=(2, 0), sticky="w"
         )
         entry = ctk.CTkEntry(
             parent,
             placeholder_text=placeholder,
-            font=("Segoe UI", 12),
+            font=get_font(FONT_INPUT),
             height=36,
             corner_radius=6,
         )
@@ -295,13 +349,13 @@ class HospitalRegistrationWindow(BaseWindow):
         required: bool = False,
     ) -> ctk.CTkComboBox:
         lbl_text = f"{label} *" if required else label
-        ctk.CTkLabel(parent, text=lbl_text, font=FONT_LABEL, anchor="w").grid(
+        ctk.CTkLabel(parent, text=lbl_text, font=get_font(FONT_LABEL), anchor="w").grid(
             row=row, column=col, columnspan=2, padx=(16, 4), pady=(2, 0), sticky="w"
         )
         combo = ctk.CTkComboBox(
             parent,
             values=values,
-            font=("Segoe UI", 12),
+            font=get_font(FONT_INPUT),
             height=36,
             corner_radius=6,
             state="readonly",
@@ -323,55 +377,53 @@ class HospitalRegistrationWindow(BaseWindow):
 
     def _collect(self) -> Optional[Hospital]:
         """Read all fields and return a Hospital dataclass (not validated yet)."""
-        try:
-            total_beds = int(self._e_beds.get().strip() or 0)
-            icu_beds   = int(self._e_icu.get().strip() or 0)
-            ot_count   = int(self._e_ot.get().strip() or 0)
-            est_year   = int(self._e_est_year.get().strip() or 0)
-        except ValueError:
+        data = dict(zip(_FIELD_NAMES, [e.get().strip() for e in self._text_entries]))
+        bad = [label for name, label in _INT_FIELDS
+               if data[name] and not is_integer_text(data[name])]
+        if bad:
             messagebox.showerror(
                 "Input Error",
-                "Total Beds, ICU Beds, Operation Theaters, and Established Year must be numeric.",
+                f"{', '.join(bad)} must be numeric.",
                 parent=self,
             )
             return None
+        for name, _ in _INT_FIELDS:
+            data[name] = int(data[name] or 0)
+        for name in _OPTIONAL_FIELDS:
+            data[name] = data[name] or None
 
         return Hospital(
-            hospital_name       = self._e_name.get().strip(),
-            registration_number = self._e_reg.get().strip(),
             hospital_type       = self._cb_type.get(),
             specialization_type = self._cb_spec.get(),
-            address_line1       = self._e_addr1.get().strip(),
-            address_line2       = self._e_addr2.get().strip() or None,
-            city                = self._e_city.get().strip(),
             state               = self._cb_state.get(),
-            pin_code            = self._e_pin.get().strip(),
-            country             = self._e_country.get().strip(),
-            phone_primary       = self._e_phone1.get().strip(),
-            phone_alternate     = self._e_phone2.get().strip() or None,
-            emergency_contact   = self._e_emergency.get().strip(),
-            email               = self._e_email.get().strip(),
-            website             = self._e_website.get().strip() or None,
-            total_beds          = total_beds,
-            icu_beds            = icu_beds,
-            operation_theaters  = ot_count,
-            administrator_name  = self._e_admin.get().strip(),
-            license_number      = self._e_license.get().strip(),
             accreditation       = self._cb_accr.get(),
-            established_year    = est_year,
-            gstin               = self._e_gstin.get().strip() or None,
+            **data,
         )
 
     def _submit(self) -> None:
+        if self._saving:
+            return
         hospital = self._collect()
         if hospital is None:
             return
 
+        # The save runs on the worker so the window keeps repainting.
+        self._saving = True
         self._status_var.set("Saving registration…")
-        self.update_idletasks()
+        future = self._executor.submit(self._service.register_hospital, hospital)
+        future.add_done_callback(self._results.put)
+        self.after(_POLL_MS, self._poll_result)
 
-        result = self._service.register_hospital(hospital)
+    def _poll_result(self) -> None:
+        try:
+            future = self._results.get_nowait()
+        except queue.Empty:
+            self.after(_POLL_MS, self._poll_result)
+            return
+        self._saving = False
+        self._apply_result(future.result())
 
+    def _apply_result(self, result) -> None:
         if result.success:
             self._status_var.set(f"✔  {result.message}")
             messagebox.showinfo("Registration Successful", result.message, parent=self)
@@ -380,19 +432,16 @@ class HospitalRegistrationWindow(BaseWindow):
             self._status_var.set(f"✘  {result.message}")
             messagebox.showerror("Validation Error", result.message, parent=self)
 
+    def destroy(self) -> None:
+        # Let a running save finish on its own; nothing new is accepted
+        self._executor.shutdown(wait=False)
+        super().destroy()
+
     def _clear_form(self) -> None:
-        for widget in [
-            self._e_name, self._e_reg, self._e_est_year, self._e_gstin,
-            self._e_addr1, self._e_addr2, self._e_city, self._e_pin,
-            self._e_phone1, self._e_phone2, self._e_emergency, self._e_email,
-            self._e_website, self._e_beds, self._e_icu, self._e_ot,
-            self._e_admin, self._e_license,
-        ]:
-            widget.delete(0, "end")
+        for entry in self._text_entries:
+            entry.delete(0, "end")
 
         self._e_country.insert(0, "India")
-        self._cb_type.set(HOSPITAL_TYPES[0])
-        self._cb_spec.set(SPECIALIZATION_TYPES[0])
-        self._cb_accr.set(ACCREDITATION_OPTIONS[0])
-        self._cb_state.set(INDIA_STATES[0])
+        for combo, default in self._combo_defaults:
+            combo.set(default)
         self._status_var.set("")
@@ -2,8 +2,10 @@
 Web Routes – View Layer (replaces customtkinter views).
 
 Maps HTTP requests to service calls and renders Jinja2 templates.
-The blueprint depends only on IHospitalService (injected via the
-module-level `container` singleton), preserving the same loose-coupling
+The blueprint depends only on IHospitalService, which the app factory
+resolves from the DI container once and attaches to
+``app.extensions["hms_service"]``; a before-request hook exposes it to the
+handlers as ``g.hospital_svc``, preserving the same loose-coupling
 contract used in the desktop app.
 
 Route map
@@ -24,9 +26,9 @@ from flask import (
     url_for,
     flash,
     g,
+    current_app,
 )
 
-from app.container import container
 from app.models.hospital import (
     Hospital,
     HOSPITAL_TYPES,
@@ -34,7 +36,7 @@ from app.models.hospital import (
     ACCREDITATION_OPTIONS,
     INDIA_STATES,
 )
-from app.services.hospital_service import IHospitalService
+from app.services.hospital_service import IHospitalService, is_integer_text
 
 # ---------------------------------------------------------------------------
 # Blueprint
@@ -46,9 +48,94 @@ web_bp = Blueprint("web", __name__)
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _service() -> IHospitalService:
-    """Resolve the hospital service from the DI container."""
-    return container.resolve(IHospitalService.__name__)
+@web_bp.before_request
+def _inject_service() -> None:
+    """Bind the app's hospital service to ``g.hospital_svc`` for this blueprint's views."""
+    g.hospital_svc = current_app.extensions["hms_service"]
+
+
+# Invariant dropdown choices passed to both form templates
+_FORM_CHOICES = {
+    "hospital_types": HOSPITAL_TYPES,
+    "specialization_types": SPECIALIZATION_TYPES,
+    "accreditation_options": ACCREDITATION_OPTIONS,
+    "india_states": INDIA_STATES,
+}
+
+# Form fields shared by the register and edit forms, as (name, default)
+_STRING_FIELDS = (
+    ("hospital_name", ""),
+    ("registration_number", ""),
+    ("hospital_type", ""),
+    ("specialization_type", ""),
+    ("address_line1", ""),
+    ("address_line2", ""),
+    ("city", ""),
+    ("state", ""),
+    ("pin_code", ""),
+    ("country", "India"),
+    ("phone_primary", ""),
+    ("phone_alternate", ""),
+    ("emergency_contact", ""),
+    ("email", ""),
+    ("website", ""),
+    ("administrator_name", ""),
+    ("license_number", ""),
+    ("accreditation", "None"),
+    ("gstin", ""),
+)
+_OPTIONAL_FIELDS = ("address_line2", "phone_alternate", "website", "gstin")
+_INT_FIELDS = (
+    ("total_beds", 0, "Total Beds"),
+    ("icu_beds", 0, "ICU Beds"),
+    ("operation_theaters", 0, "Operation Theaters"),
+    ("established_year", 2000, "Established Year"),
+)
+
+
+def _numeric_field_error(form_data: dict) -> str | None:
+    """Return an error naming any non-numeric integer field, else None."""
+    bad = [
+        label
+        for name, _, label in _INT_FIELDS
+        if (value := form_data.get(name, "").strip()) and not is_integer_text(value)
+    ]
+    return f"Invalid input: {', '.join(bad)} must be numeric." if bad else None
+
+
+def _compile_form_builder():
+    """
+    Generate the form-to-Hospital builder from the field tables above.
+
+    The generated function is one ``Hospital(...)`` call whose arguments
+    read, strip and convert each field inline, so a POST builds no
+    intermediate kwargs dict and runs no per-field loops.
+    """
+    args = []
+    for name, default in _STRING_FIELDS:
+        expr = f"get({name!r}, {default!r}).strip()"
+        if name in _OPTIONAL_FIELDS:
+            expr += " or None"
+        args.append(f"{name}={expr}")
+    for name, default, _ in _INT_FIELDS:
+        args.append(f"{name}=_int(get({name!r}, '').strip() or {default!r})")
+    src = (
+        "def _build_hospital_from_form(form_data, hospital_id=None):\n"
+        "    get = form_data.get\n"
+        f"    return _Hospital(id=hospital_id, {', '.join(args)})\n"
+    )
+    namespace: dict = {"_Hospital": Hospital, "_int": int}
+    exec(compile(src, "<hms form builder>", "exec"), namespace)
+    builder = namespace["_build_hospital_from_form"]
+    builder.__doc__ = (
+        "Build a Hospital from the submitted form (as a plain dict).\n\n"
+        "Check the form with _numeric_field_error first; a non-numeric\n"
+        "integer field raises ValueError."
+    )
+    return builder
+
+
+_build_hospital_from_form = _compile_form_builder()
 
 
 # ---------------------------------------------------------------------------
@@ -68,9 +155,7 @@ def index():
     If none supplied all active hospitals are listed.
     On very first run (no hospitals) redirect to registration.
     """
-    svc = _service()
-    if svc.is_first_run():
-        return redirect(url_for("web.register"))
+    svc: IHospitalService = g.hospital_svc
 
     # Read optional search params
     q_name = request.args.get("name", "").strip()
@@ -92,6 +177,10 @@ def index():
         hospital_id=q_id,
         city=q_city or None,
     )
+    # The unfiltered listing doubles as the first-run probe; the COUNT-style
+    # check only runs when it comes back empty.
+    if not searching and not hospitals and svc.is_first_run():
+        return redirect(url_for("web.register"))
 
     return render_template(
         "home.html",
@@ -107,66 +196,23 @@ def index():
 @web_bp.route("/register", methods=["GET", "POST"])
 def register():
     """Hospital registration form – GET renders, POST processes."""
-    svc = _service()
+    svc: IHospitalService = g.hospital_svc
     form_data: dict = {}
     error: str | None = None
 
     if request.method == "POST":
-        fd = request.form
-        form_data = fd.to_dict()
-
-        # Build Hospital object from form
-        try:
-            hospital = Hospital(
-                hospital_name=fd.get("hospital_name", "").strip(),
-                registration_number=fd.get("registration_number", "").strip(),
-                hospital_type=fd.get("hospital_type", "").strip(),
-                specialization_type=fd.get("specialization_type", "").strip(),
-                address_line1=fd.get("address_line1", "").strip(),
-                address_line2=fd.get("address_line2", "").strip() or None,
-                city=fd.get("city", "").strip(),
-                state=fd.get("state", "").strip(),
-                pin_code=fd.get("pin_code", "").strip(),
-                country=fd.get("country", "India").strip(),
-                phone_primary=fd.get("phone_primary", "").strip(),
-                phone_alternate=fd.get("phone_alternate", "").strip() or None,
-                emergency_contact=fd.get("emergency_contact", "").strip(),
-                email=fd.get("email", "").strip(),
-                website=fd.get("website", "").strip() or None,
-                total_beds=int(fd.get("total_beds") or 0),
-                icu_beds=int(fd.get("icu_beds") or 0),
-                operation_theaters=int(fd.get("operation_theaters") or 0),
-                administrator_name=fd.get("administrator_name", "").strip(),
-                license_number=fd.get("license_number", "").strip(),
-                accreditation=fd.get("accreditation", "None").strip(),
-                established_year=int(fd.get("established_year") or 2000),
-                gstin=fd.get("gstin", "").strip() or None,
-            )
-        except (ValueError, TypeError) as exc:
-            error = f"Invalid input: {exc}"
-            return render_template(
-                "hospital_registration.html",
-                hospital_types=HOSPITAL_TYPES,
-                specialization_types=SPECIALIZATION_TYPES,
-                accreditation_options=ACCREDITATION_OPTIONS,
-                india_states=INDIA_STATES,
-                form_data=form_data,
-                error=error,
-            )
-
-        result = svc.register_hospital(hospital)
-        if result.success:
-            flash(result.message, "success")
-            return redirect(url_for("web.index"))
-        else:
+        form_data = request.form.to_dict()
+        error = _numeric_field_error(form_data)
+        if error is None:
+            result = svc.register_hospital(_build_hospital_from_form(form_data))
+            if result.success:
+                flash(result.message, "success")
+                return redirect(url_for("web.index"))
             error = result.message
 
     return render_template(
         "hospital_registration.html",
-        hospital_types=HOSPITAL_TYPES,
-        specialization_types=SPECIALIZATION_TYPES,
-        accreditation_options=ACCREDITATION_OPTIONS,
-        india_states=INDIA_STATES,
+        **_FORM_CHOICES,
         form_data=form_data,
         error=error,
     )
@@ -175,7 +221,7 @@ def register():
 @web_bp.route("/dashboard/<int:hospital_id>")
 def dashboard(hospital_id: int):
     """Hospital landing / dashboard page."""
-    svc = _service()
+    svc: IHospitalService = g.hospital_svc
     hospital = svc.get_hospital(hospital_id)
     if hospital is None:
         flash("Hospital not found.", "error")
@@ -186,7 +232,7 @@ def dashboard(hospital_id: int):
 @web_bp.route("/hospital/<int:hospital_id>/edit", methods=["GET", "POST"])
 def edit_hospital(hospital_id: int):
     """Hospital edit form – GET pre-fills with existing data, POST validates and updates."""
-    svc = _service()
+    svc: IHospitalService = g.hospital_svc
     hospital = svc.get_hospital(hospital_id)
     if hospital is None:
         flash("Hospital not found.", "error")
@@ -196,62 +242,19 @@ def edit_hospital(hospital_id: int):
     form_data: dict = {}
 
     if request.method == "POST":
-        fd = request.form
-        form_data = fd.to_dict()
-        try:
-            updated = Hospital(
-                id=hospital_id,
-                hospital_name=fd.get("hospital_name", "").strip(),
-                registration_number=fd.get("registration_number", "").strip(),
-                hospital_type=fd.get("hospital_type", "").strip(),
-                specialization_type=fd.get("specialization_type", "").strip(),
-                address_line1=fd.get("address_line1", "").strip(),
-                address_line2=fd.get("address_line2", "").strip() or None,
-                city=fd.get("city", "").strip(),
-                state=fd.get("state", "").strip(),
-                pin_code=fd.get("pin_code", "").strip(),
-                country=fd.get("country", "India").strip(),
-                phone_primary=fd.get("phone_primary", "").strip(),
-                phone_alternate=fd.get("phone_alternate", "").strip() or None,
-                emergency_contact=fd.get("emergency_contact", "").strip(),
-                email=fd.get("email", "").strip(),
-                website=fd.get("website", "").strip() or None,
-                total_beds=int(fd.get("total_beds") or 0),
-                icu_beds=int(fd.get("icu_beds") or 0),
-                operation_theaters=int(fd.get("operation_theaters") or 0),
-                administrator_name=fd.get("administrator_name", "").strip(),
-                license_number=fd.get("license_number", "").strip(),
-                accreditation=fd.get("accreditation", "None").strip(),
-                established_year=int(fd.get("established_year") or 2000),
-                gstin=fd.get("gstin", "").strip() or None,
-            )
-        except (ValueError, TypeError) as exc:
-            error = f"Invalid input: {exc}"
-            return render_template(
-                "hospital_edit.html",
-                hospital=hospital,
-                hospital_types=HOSPITAL_TYPES,
-                specialization_types=SPECIALIZATION_TYPES,
-                accreditation_options=ACCREDITATION_OPTIONS,
-                india_states=INDIA_STATES,
-                form_data=form_data,
-                error=error,
-            )
-
-        result = svc.update_hospital(updated)
-        if result.success:
-            flash(result.message, "success")
-            return redirect(url_for("web.dashboard", hospital_id=hospital_id))
-        else:
+        form_data = request.form.to_dict()
+        error = _numeric_field_error(form_data)
+        if error is None:
+            result = svc.update_hospital(_build_hospital_from_form(form_data, hospital_id))
+            if result.success:
+                flash(result.message, "success")
+                return redirect(url_for("web.dashboard", hospital_id=hospital_id))
             error = result.message
 
     return render_template(
         "hospital_edit.html",
         hospital=hospital,
-        hospital_types=HOSPITAL_TYPES,
-        specialization_types=SPECIALIZATION_TYPES,
-        accreditation_options=ACCREDITATION_OPTIONS,
-        india_states=INDIA_STATES,
+        **_FORM_CHOICES,
         form_data=form_data,
         error=error,
     )
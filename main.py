@@ -21,52 +21,83 @@ from __future__ import annotations
 
 import os
 import sys
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, Optional
 
 # ---------------------------------------------------------------------------
-# Make sure the project root is on sys.path so imports work on all OSes
+# Project root (locates .env and the default data directory).  No sys.path
+# edits are needed: main.py sits next to the ``app`` package, so whatever
+# put main on the path (``python main.py``, gunicorn/waitress run from the
+# project root) already makes ``app`` importable.  Deployments may pin the
+# root with HMS_ROOT; otherwise it is derived lexically with os.path.abspath,
+# skipping the stat() walk of Path.resolve().
 # ---------------------------------------------------------------------------
-PROJECT_ROOT = Path(__file__).resolve().parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
+PROJECT_ROOT = Path(os.environ.get("HMS_ROOT") or os.path.dirname(os.path.abspath(__file__)))
 
 # ---------------------------------------------------------------------------
 # Load .env file when running locally (python-dotenv).
-# In production (Railway / Render / PythonAnywhere) real env vars are used.
+# In production (Railway / Render / PythonAnywhere) real env vars are used,
+# so neither dotenv nor the file is touched there or when no .env exists.
 # ---------------------------------------------------------------------------
-try:
-    from dotenv import load_dotenv
-    load_dotenv(PROJECT_ROOT / ".env")
-except ImportError:
-    pass  # python-dotenv not installed – rely on real environment variables
+_ENV_FILE = PROJECT_ROOT / ".env"
+if os.environ.get("FLASK_ENV") != "production" and _ENV_FILE.is_file():
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(_ENV_FILE)
+    except ImportError:
+        pass  # python-dotenv not installed – rely on real environment variables
 
 # ---------------------------------------------------------------------------
-# Third-party
+# Flask and the application modules are imported inside the factory, so
+# importing this module (e.g. by a gunicorn master or a CLI that never
+# builds the app) stays cheap.
 # ---------------------------------------------------------------------------
-from flask import Flask
+if TYPE_CHECKING:
+    from flask import Flask
+    from app.container import DIContainer
 
-# ---------------------------------------------------------------------------
-# Application modules (unchanged from desktop version)
-# ---------------------------------------------------------------------------
-from app.container import container, DIContainer
-from app.database.connection import DatabaseConnection
-from app.database.schema import SchemaManager
-from app.repositories.hospital_repository import HospitalRepository, IHospitalRepository
-from app.services.hospital_service import HospitalService, IHospitalService
 
 # ---------------------------------------------------------------------------
-# Web layer (replaces customtkinter views)
+# Configuration (read from the environment once per process)
 # ---------------------------------------------------------------------------
-from app.web.routes import web_bp
+
+class _Cfg(NamedTuple):
+    secret_key: Optional[str]
+    flask_env: str
+    port: int
+    data_dir: Path
+    db_path: Path
+
+
+@cache
+def cfg() -> _Cfg:
+    """
+    Return the process configuration, reading os.environ on first use.
+
+    In production set DATA_DIR to a persistent disk path (e.g. /data);
+    locally it defaults to <project_root>/data/.
+    """
+    data_dir = Path(os.environ.get("DATA_DIR", str(PROJECT_ROOT / "data")))
+    return _Cfg(
+        secret_key=os.environ.get("SECRET_KEY") or None,
+        flask_env=os.environ.get("FLASK_ENV", "development"),
+        port=int(os.environ.get("PORT", 5000)),
+        data_dir=data_dir,
+        db_path=data_dir / "hms.db",
+    )
 
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
-# In production set DATA_DIR env var to a persistent disk path (e.g. /data).
-# Locally it defaults to <project_root>/data/
-DATA_DIR = Path(os.environ.get("DATA_DIR", str(PROJECT_ROOT / "data")))
-DB_PATH  = DATA_DIR / "hms.db"
+# Page templates compiled during start-up instead of on their first request
+_WARM_TEMPLATES = (
+    "home.html",
+    "hospital_registration.html",
+    "hospital_edit.html",
+    "hospital_landing.html",
+)
 
 
 # ---------------------------------------------------------------------------
@@ -74,43 +105,105 @@ DB_PATH  = DATA_DIR / "hms.db"
 # ---------------------------------------------------------------------------
 
 def _bootstrap_container(ioc: DIContainer) -> None:
-    """Wire all dependencies into the DI container."""
+    """
+    Wire all dependencies into the DI container.
+
+    Idempotent: a container whose graph is already built is left
+    untouched, so repeated factory calls keep the existing singletons.
+    """
+    from app.container import Services
+    from app.database.connection import DatabaseConnection
+    from app.repositories.hospital_repository import HospitalRepository, IHospitalRepository
+    from app.services.hospital_service import HospitalService, IHospitalService
+
+    if ioc.services is not None:
+        return
 
     # --- Infrastructure ---
+    # Always a lazy singleton (never register_instance) so the database file
+    # is only opened when something actually queries it.
     ioc.register_singleton(
         "DatabaseConnection",
-        lambda: DatabaseConnection(DB_PATH),
+        lambda: DatabaseConnection(cfg().db_path),
     )
 
     # --- Repositories ---
     ioc.register_singleton(
-        IHospitalRepository.__name__,
+        IHospitalRepository,
         lambda: HospitalRepository(ioc.resolve("DatabaseConnection")),
     )
 
     # --- Services ---
     ioc.register_singleton(
-        IHospitalService.__name__,
-        lambda: HospitalService(ioc.resolve(IHospitalRepository.__name__)),
+        IHospitalService,
+        lambda: HospitalService(ioc.resolve(IHospitalRepository)),
     )
 
+    # --- Build the graph now, dependencies first ---
+    # Constructing DatabaseConnection does no I/O, so the database file is
+    # still only opened by the first query.
+    ioc.eager_resolve((
+        "DatabaseConnection",
+        IHospitalRepository,
+        IHospitalService,
+    ))
+    ioc.services = Services(
+        db=ioc.resolve("DatabaseConnection"),
+        hospital_repo=ioc.resolve(IHospitalRepository),
+        hospital_svc=ioc.resolve(IHospitalService),
+    )
+
+
+def bootstrap() -> None:
+    """
+    Wire the DI container and bring the database schema up to date.
+
+    Idempotent; called by create_app().  Under ``gunicorn --preload
+    "main:create_app()"`` that call happens once in the master, so forked
+    workers inherit the wiring and skip the migration check.
+    DatabaseConnection reopens its connections in each child.
+    """
+    from app.container import container, db
+    from app.database.schema import SchemaManager
+
+    _bootstrap_container(container)
+    SchemaManager(db()).migrate_if_needed()
+
 
 # ---------------------------------------------------------------------------
 # Flask Application Factory
 # ---------------------------------------------------------------------------
 
-def create_app() -> Flask:
+# The app built by the last create_app() call in this process
+_APP: Flask | None = None
+
+
+def create_app(force: bool = False) -> Flask:
     """
     Flask application factory.
 
     Called by gunicorn in production:  gunicorn "main:create_app()"
     Called directly in development:    python main.py
 
+    The app is built once per process and returned as-is by later calls;
+    pass ``force=True`` (or call ``reset_app()`` first) to build a fresh one.
+
     Steps:
-    1. Bootstrap DI container.
-    2. Run database migrations.
-    3. Register the web blueprint.
+    1. Bootstrap DI container and run database migrations (skipped when
+       the schema is current).
+    2. Register the web blueprint.
+    3. Warm up templates and the service so the first request is not slow.
     """
+    global _APP
+    if _APP is not None and not force:
+        return _APP
+
+    from flask import Flask
+
+    from app.container import container
+    # Web layer (replaces customtkinter views)
+    from app.web.routes import web_bp
+
     app = Flask(
         __name__,
         template_folder="app/templates",
@@ -119,42 +212,77 @@ def create_app() -> Flask:
 
     # SECRET_KEY must be set via environment variable in production.
     # A missing key raises at startup so it is never silently insecure.
-    secret = os.environ.get("SECRET_KEY")
+    config = cfg()
+    secret = config.secret_key
     if not secret:
-        if os.environ.get("FLASK_ENV") == "production":
+        if config.flask_env == "production":
             raise RuntimeError(
                 "SECRET_KEY environment variable is not set. "
                 "Set it before starting the server in production."
             )
         # Development fallback – never used in production
         secret = "hms-dev-only-secret-change-me"
-    app.secret_key = secret
+    # Stored pre-encoded: itsdangerous signs with bytes, so a str key would
+    # be re-encoded on every session sign/verify.
+    app.secret_key = secret.encode("utf-8")
 
-    # 1. Wire dependencies
-    _bootstrap_container(container)
+    # 1. Wire dependencies and migrate
+    bootstrap()
+    # Routes read the service from app.extensions
+    app.extensions["hms_service"] = container.services.hospital_svc
 
-    # 2. Run migrations
-    db: DatabaseConnection = container.resolve("DatabaseConnection")
-    SchemaManager(db).migrate()
-
-    # 3. Register blueprint (web routes replace customtkinter views)
+    # 2. Register blueprint (web routes replace customtkinter views)
     app.register_blueprint(web_bp)
 
+    # 3. Warm-up: compile the URL map (werkzeug defers its one-off sort and
+    #    matcher build to the first match) and the Jinja templates, and run
+    #    the home page's first-run probe once, priming the statement cache.
+    app.url_map.update()
+    for name in _WARM_TEMPLATES:
+        app.jinja_env.get_template(name)
+    app.extensions["hms_service"].is_first_run()
+
+    _APP = app
     return app
 
 
+def reset_app() -> None:
+    """Forget the cached app so the next create_app() builds a new one."""
+    global _APP
+    _APP = None
+
+
 # ---------------------------------------------------------------------------
 # Entry Point  (development only – production uses gunicorn)
 # ---------------------------------------------------------------------------
 
 def main() -> None:
+    from werkzeug.serving import run_simple
+
     app = create_app()
-    port  = int(os.environ.get("PORT", 5000))
-    debug = os.environ.get("FLASK_ENV", "development") != "production"
-    print("\n  HMS Web Application")
-    print("  -------------------")
-    print(f"  Open http://127.0.0.1:{port} in your browser\n")
-    app.run(debug=debug, port=port, use_reloader=False)
+    config = cfg()
+    port  = config.port
+    debug = config.flask_env != "production"
+    # Interactive runs only; container logs don't need the banner
+    if sys.stdout.isatty():
+        sys.stdout.write(
+            "\n  HMS Web Application\n"
+            "  -------------------\n"
+            f"  Open http://127.0.0.1:{port} in your browser\n\n"
+        )
+    # Serve directly rather than through Flask.run.  The threaded server
+    # starts a thread per request; each takes a pooled SQLite connection
+    # that is handed back for reuse when the thread ends, so requests run
+    # concurrently (WAL readers in parallel) without opening one apiece.
+    app.debug = debug
+    run_simple(
+        "127.0.0.1",
+        port,
+        app,
+        use_debugger=debug,
+        use_reloader=False,
+        threaded=True,
+    )
 
 
 if __name__ == "__main__":